@@ -31,6 +31,13 @@ if __name__ == "__main__":
         help="""Use this option to give the file for a single configuration to run
         in the configuration directory instead of running all of the yaml files.""",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of simulations to run in parallel",
+    )
     parser.add_argument("-v", "--verbose", action="count", default=0)
 
     args = parser.parse_args()
@@ -63,4 +70,9 @@ if __name__ == "__main__":
         else:
             cfgs.append(Config.load(config_path))
 
-    run_batch(cfgs, output_directory_path, verbosity_level=args.verbose)
+    run_batch(
+        cfgs,
+        output_directory_path,
+        verbosity_level=args.verbose,
+        number_of_processes=args.jobs,
+    )
@@ -4,55 +4,57 @@ import numpy as np
 from scipy.optimize import fsolve
 from ..state import State
 from ..params import Config, PhysicalParams
-from .phase_boundaries import get_phase_masks
 
 
 def calculate_common_enthalpy_method_vars(
     state: State, cfg: Config, phase_masks
 ) -> Tuple[NDArray, NDArray, NDArray, NDArray]:
     physical_params = cfg.physical_params
-    phase_masks = get_phase_masks(state, physical_params)
-    solid_fraction = _calculate_solid_fraction(state, physical_params, phase_masks)
+    salt = _regularise_salt(state.salt, physical_params)
+    solid_fraction = _calculate_solid_fraction(
+        state.enthalpy, salt, physical_params, phase_masks
+    )
     liquid_fraction = _calculate_liquid_fraction(solid_fraction)
     temperature = _calculate_temperature(
-        state, solid_fraction, physical_params, phase_masks
-    )
-    liquid_salinity = _calculate_liquid_salinity(
-        state, temperature, phase_masks, physical_params
+        state.enthalpy, solid_fraction, physical_params, phase_masks
     )
+    liquid_salinity = _calculate_liquid_salinity(salt, temperature, phase_masks)
     return solid_fraction, liquid_fraction, temperature, liquid_salinity
 
 
-def _calculate_solid_fraction(state, physical_params: PhysicalParams, phase_masks):
-    enthalpy, salt = state.enthalpy, state.salt
-
-    # don't let salinity go below 1e-6
+def _regularise_salt(salt: NDArray, physical_params: PhysicalParams) -> NDArray:
+    """don't let salinity go below 1e-6"""
     conc = physical_params.concentration_ratio
-    salt = np.where(salt + conc < 1e-6, -conc + 1e-6, salt)
+    return np.where(salt + conc < 1e-6, -conc + 1e-6, salt)
 
-    solid_fraction = np.full_like(enthalpy, np.nan)
-    L, M, E, S = phase_masks
-    St = physical_params.stefan_number
-    ratio = physical_params.specific_heat_ratio
 
-    solid_fraction[L] = 0
-    solid_fraction[E] = -(1 + enthalpy[E]) / (St + ratio - 1)
-    solid_fraction[S] = 1
+def _calculate_solid_fraction(
+    enthalpy: NDArray, salt: NDArray, physical_params: PhysicalParams, phase_masks
+) -> NDArray:
+    """Calculate the solid fraction in every phase with a single np.select pass.
 
-    if np.all(M == False):
-        return solid_fraction
+    For the linear liquidus the mushy layer solid fraction is the root of a quadratic
+    which is evaluated over the whole domain and then selected in the mushy cells.
 
-    # Linear lqiuidus
-    if physical_params.get_liquidus_salinity is None:
-        A = St + conc * (1 - ratio)
-        B = enthalpy[M] - St - conc + salt[M] * (1 - ratio)
-        C = -(enthalpy[M] + salt[M])
+    Phase masks may overlap for unphysical states, in which case the mushy solution
+    takes precedence followed by the colder phase.
 
-        solid_fraction[M] = (1 / (2 * A)) * (-B - np.sqrt(B**2 - 4 * A * C))
-        return solid_fraction
+    salt must already be regularised so that the bulk salinity is positive.
+    """
+    L, M, E, S = phase_masks
+    conc = physical_params.concentration_ratio
+    St = physical_params.stefan_number
+    ratio = physical_params.specific_heat_ratio
+
+    eutectic_solid_fraction = -(1 + enthalpy) / (St + ratio - 1)
 
     # Cubic liquidus
-    else:
+    if physical_params.get_liquidus_salinity is not None:
+        solid_fraction = np.select(
+            [S, E, L], [1.0, eutectic_solid_fraction, 0.0], default=np.nan
+        )
+        if not np.any(M):
+            return solid_fraction
 
         def residual(solid_fraction):
             temperature = (enthalpy[M] + solid_fraction * St) / (
@@ -66,46 +68,66 @@ def _calculate_solid_fraction(state, physical_params: PhysicalParams, phase_mask
             )
 
         solid_fraction[M] = fsolve(residual, np.full_like(enthalpy[M], 0.5))
+        return solid_fraction
 
-    return solid_fraction
+    # Linear liquidus
+    A = St + conc * (1 - ratio)
+    B = enthalpy - St - conc + salt * (1 - ratio)
+    C = -(enthalpy + salt)
+
+    # The discriminant is only guaranteed positive in the mushy layer
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mush_solid_fraction = _calculate_quadratic_root(A, B, C)
+
+    return np.select(
+        [M, S, E, L],
+        [mush_solid_fraction, 1.0, eutectic_solid_fraction, 0.0],
+        default=np.nan,
+    )
+
+
+def _calculate_quadratic_root(A, B, C):
+    """Return the root (-B - sqrt(B^2 - 4AC)) / 2A of the quadratic with coefficients
+    A, B and C in the numerically stable form which avoids cancellation near the
+    liquidus where the solid fraction is small.
+
+    Both the sign of the square root and the choice of formula are taken from the
+    sign bit of B so that they agree when B is -0.0.
+    """
+    B_is_negative = np.signbit(B)
+    square_root = np.sqrt(B * B - 4 * A * C)
+    q = -0.5 * (B + np.where(B_is_negative, -square_root, square_root))
+    return np.where(B_is_negative, C / q, q / A)
 
 
 def _calculate_temperature(
-    state, solid_fraction, physical_params: PhysicalParams, phase_masks
-):
-    enthalpy = state.enthalpy
+    enthalpy: NDArray,
+    solid_fraction: NDArray,
+    physical_params: PhysicalParams,
+    phase_masks,
+) -> NDArray:
     L, M, E, S = phase_masks
     St = physical_params.stefan_number
     ratio = physical_params.specific_heat_ratio
 
-    temperature = np.full_like(enthalpy, np.nan)
-    temperature[L] = enthalpy[L]
-    temperature[M] = (enthalpy[M] + solid_fraction[M] * St) / (
-        1 + (ratio - 1) * solid_fraction[M]
+    # where phase masks overlap the colder phase takes precedence
+    mush_temperature = (enthalpy + solid_fraction * St) / (
+        1 + (ratio - 1) * solid_fraction
+    )
+    return np.select(
+        [S, E, M, L],
+        [(enthalpy + St) / ratio, -1.0, mush_temperature, enthalpy],
+        default=np.nan,
     )
-    temperature[E] = -1
-    temperature[S] = (enthalpy[S] + St) / ratio
-
-    return temperature
 
 
 def _calculate_liquid_fraction(solid_fraction):
     return 1 - solid_fraction
 
 
-def _calculate_liquid_salinity(state, temperature, phase_masks, physical_params):
-    salt = state.salt
-
-    # don't let salinity go below 1e-6
-    conc = physical_params.concentration_ratio
-    salt = np.where(salt + conc < 1e-6, -conc + 1e-6, salt)
-
-    liquid_salinity = np.full_like(salt, np.nan)
+def _calculate_liquid_salinity(
+    salt: NDArray, temperature: NDArray, phase_masks
+) -> NDArray:
+    """salt must already be regularised so that the bulk salinity is positive"""
     L, M, E, S = phase_masks
-
-    liquid_salinity[L] = salt[L]
-    liquid_salinity[M] = -temperature[M]
-    liquid_salinity[E] = 1
-    liquid_salinity[S] = 1
-
-    return liquid_salinity
+    return np.select([E | S, M, L], [1.0, -temperature, salt], default=np.nan)
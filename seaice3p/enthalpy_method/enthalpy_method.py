@@ -19,8 +19,10 @@ def get_enthalpy_method(cfg: Config) -> Callable[[State], StateFull]:
         DISEQPhysicalParams: _calculate_DISEQ_enthalpy_method,
     }
 
+    calculate_enthalpy_method = fun_map[type(cfg.physical_params)]
+
     def enthalpy_method(state: State) -> StateFull:
-        return fun_map[type(cfg.physical_params)](state, cfg)
+        return calculate_enthalpy_method(state, cfg)
 
     return enthalpy_method
 
@@ -9,16 +9,11 @@ def calculate_EQM_gas_fraction(
 ) -> NDArray:
     chi = physical_params.expansion_coefficient
     tolerable_super_saturation = physical_params.tolerable_super_saturation_fraction
-    gas_fraction = np.full_like(liquid_fraction, np.nan)
 
-    gas_sat = chi * liquid_fraction * tolerable_super_saturation
+    gas_sat = np.multiply(chi * tolerable_super_saturation, liquid_fraction)
     is_super_saturated = state.gas >= gas_sat
-    is_sub_saturated = ~is_super_saturated
-    gas_fraction[is_super_saturated] = (
-        state.gas[is_super_saturated] - gas_sat[is_super_saturated]
-    )
-    gas_fraction[is_sub_saturated] = 0
-    return gas_fraction
+    np.subtract(state.gas, gas_sat, out=gas_sat)
+    return np.where(is_super_saturated, gas_sat, 0.0)
 
 
 def calculate_EQM_dissolved_gas(
@@ -27,20 +22,20 @@ def calculate_EQM_dissolved_gas(
     chi = physical_params.expansion_coefficient
     gas = state.gas
     tolerable_super_saturation = physical_params.tolerable_super_saturation_fraction
-    dissolved_gas = np.zeros_like(gas)
 
     # If no dissolved phase
     if chi == 0:
-        return dissolved_gas
+        return np.zeros_like(gas)
 
     gas_sat = chi * liquid_fraction * tolerable_super_saturation
     is_super_saturated = gas >= gas_sat
-    is_sub_saturated = ~is_super_saturated
-    dissolved_gas[is_super_saturated] = tolerable_super_saturation
-    dissolved_gas[is_sub_saturated] = gas[is_sub_saturated] / (
-        chi * liquid_fraction[is_sub_saturated]
+
+    # sub saturated value is only selected where the liquid fraction is non zero
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sub_saturated_dissolved_gas = gas / (chi * liquid_fraction)
+    return np.where(
+        is_super_saturated, tolerable_super_saturation, sub_saturated_dissolved_gas
     )
-    return dissolved_gas
 
 
 def calculate_DISEQ_dissolved_gas(
@@ -53,11 +48,16 @@ def calculate_DISEQ_dissolved_gas(
     # prevent dissolved gas concentration blowing up during total freezing
     REGULARISATION = 1e-6
 
-    dissolved_gas = np.full_like(bulk_dissolved_gas, np.nan)
-    dissolved_gas[L] = bulk_dissolved_gas[L] / chi
-    dissolved_gas[M] = bulk_dissolved_gas[M] / (chi * liquid_fraction[M])
-    dissolved_gas[E] = bulk_dissolved_gas[E] / (
-        chi * liquid_fraction[E] + REGULARISATION
+    # mushy value is only selected where the liquid fraction is non zero
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mush_dissolved_gas = bulk_dissolved_gas / (chi * liquid_fraction)
+    return np.select(
+        [S, E, M, L],
+        [
+            0.0,
+            bulk_dissolved_gas / (chi * liquid_fraction + REGULARISATION),
+            mush_dissolved_gas,
+            bulk_dissolved_gas / chi,
+        ],
+        default=np.nan,
     )
-    dissolved_gas[S] = 0
-    return dissolved_gas
@@ -19,39 +19,61 @@ from ...state import StateBCs, EQMStateBCs, DISEQStateBCs
 
 def get_brine_convection_sink(
     cfg: Config, grids: Grids
-) -> Callable[[StateBCs], NDArray]:
+) -> Callable[[StateBCs, NDArray], None]:
+    """Return function to subtract the brine convection sink terms in place from the
+    right hand side of the equations.
+
+    Without brine convection there is no sink, so the returned function leaves the
+    right hand side untouched rather than subtracting arrays of zeros.
+    """
+    if isinstance(cfg.brine_convection_params, NoBrineConvection):
+
+        def no_brine_convection_sink(state_BCs: StateBCs, rhs: NDArray) -> None:
+            pass
+
+        return no_brine_convection_sink
+
     fun_map = {
         EQMPhysicalParams: _EQM_brine_convection_sink,
         DISEQPhysicalParams: _DISEQ_brine_convection_sink,
     }
 
-    def brine_convection_sink(state_BCs: StateBCs) -> NDArray:
-        return fun_map[type(cfg.physical_params)](state_BCs, cfg, grids)
+    subtract_brine_convection_sink = fun_map[type(cfg.physical_params)]
+
+    def brine_convection_sink(state_BCs: StateBCs, rhs: NDArray) -> None:
+        subtract_brine_convection_sink(state_BCs, cfg, grids, rhs)
 
     return brine_convection_sink
 
 
-def _EQM_brine_convection_sink(state_BCs: EQMStateBCs, cfg, grids) -> NDArray:
+def _EQM_brine_convection_sink(
+    state_BCs: EQMStateBCs, cfg, grids, rhs: NDArray
+) -> None:
     """TODO: check the sink terms for bulk_dissolved_gas and gas fraction
 
     For now neglect the coupling of bubbles to the horizontal or vertical flow
     """
-    heat_sink = _calculate_heat_sink(state_BCs, cfg, grids)
-    salt_sink = _calculate_salt_sink(state_BCs, cfg, grids)
-    gas_sink = _calculate_gas_sink(state_BCs, cfg, grids)
-    return np.hstack((heat_sink, salt_sink, gas_sink))
+    # views onto the parts of the right hand side for each equation
+    enthalpy_rhs, salt_rhs, gas_rhs = np.split(rhs, 3)
+    enthalpy_rhs -= _calculate_heat_sink(state_BCs, cfg, grids)
+    salt_rhs -= _calculate_salt_sink(state_BCs, cfg, grids)
+    gas_rhs -= _calculate_gas_sink(state_BCs, cfg, grids)
 
 
-def _DISEQ_brine_convection_sink(state_BCs: DISEQStateBCs, cfg, grids) -> NDArray:
+def _DISEQ_brine_convection_sink(
+    state_BCs: DISEQStateBCs, cfg, grids, rhs: NDArray
+) -> None:
     """TODO: check the sink terms for bulk_dissolved_gas and gas fraction
 
     For now neglect the coupling of bubbles to the horizontal or vertical flow
+
+    There is no sink term for the gas fraction.
     """
-    heat_sink = _calculate_heat_sink(state_BCs, cfg, grids)
-    salt_sink = _calculate_salt_sink(state_BCs, cfg, grids)
-    bulk_dissolved_gas_sink = _calculate_bulk_dissolved_gas_sink(state_BCs, cfg, grids)
-    gas_fraction_sink = np.zeros_like(heat_sink)
-    return np.hstack((heat_sink, salt_sink, bulk_dissolved_gas_sink, gas_fraction_sink))
+    # views onto the parts of the right hand side for each equation
+    enthalpy_rhs, salt_rhs, bulk_dissolved_gas_rhs, _ = np.split(rhs, 4)
+    enthalpy_rhs -= _calculate_heat_sink(state_BCs, cfg, grids)
+    salt_rhs -= _calculate_salt_sink(state_BCs, cfg, grids)
+    bulk_dissolved_gas_rhs -= _calculate_bulk_dissolved_gas_sink(state_BCs, cfg, grids)
 
 
 def _calculate_heat_sink(state_BCs, cfg: Config, grids):
@@ -36,8 +36,13 @@ def calculate_permeability(liquid_fraction, cfg: Config):
     if cfg.bubble_params.porosity_threshold:
         cutoff = cfg.bubble_params.porosity_threshold_value
         step_function = np.heaviside(liquid_fraction - cutoff, 0)
-        return liquid_fraction**2 * (liquid_fraction - cutoff) * step_function
-    return liquid_fraction**3
+        return (
+            liquid_fraction
+            * liquid_fraction
+            * (liquid_fraction - cutoff)
+            * step_function
+        )
+    return liquid_fraction * liquid_fraction * liquid_fraction
 
 
 def calculate_integrated_mean_permeability(
@@ -63,10 +68,14 @@ def calculate_integrated_mean_permeability(
     if z < -ice_depth:
         return 0
     step = cfg.numerical_params.step
-    ice_mask = (cell_centers > -ice_depth) & (cell_centers <= z)
+
+    # cell centers are increasing so the cells in the ice below z are a contiguous
+    # slice which we locate by bisection rather than a boolean mask
+    bottom = np.searchsorted(cell_centers, -ice_depth, side="right")
+    top = np.searchsorted(cell_centers, z, side="right")
+    ice_liquid_fraction = liquid_fraction[bottom:top]
     permeabilities = (
-        calculate_permeability(liquid_fraction[ice_mask], cfg)
-        / liquid_fraction[ice_mask].size
+        calculate_permeability(ice_liquid_fraction, cfg) / ice_liquid_fraction.size
     )
     harmonic_mean = hmean(permeabilities)
     return (ice_depth + z + step / 2) * harmonic_mean / step
@@ -241,10 +250,12 @@ def calculate_brine_convection_liquid_velocity(
     # Make liquid vertical velocity continuous at bottom of the ice
     ocean_velocity = brine_channel_strength * (ice_depth + convecting_region_height)
 
-    is_convecting_ice = (edge_grid >= -ice_depth) & (
-        edge_grid <= convecting_region_height
-    )
-    is_liquid = edge_grid < -ice_depth
+    # the grid is increasing so the liquid and convecting ice regions are contiguous
+    # slices
+    ice_base = np.searchsorted(edge_grid, -ice_depth, side="left")
+    convecting_top = np.searchsorted(edge_grid, convecting_region_height, side="right")
+    is_convecting_ice = np.s_[ice_base:convecting_top]
+    is_liquid = np.s_[:ice_base]
 
     Wl[is_convecting_ice] = brine_channel_strength * (
         convecting_region_height - edge_grid[is_convecting_ice]
@@ -300,10 +311,14 @@ def calculate_brine_channel_sink(
 
     # Make liquid vertical velocity continuous at bottom of the ice
 
-    is_convecting_ice = (center_grid >= -ice_depth) & (
-        center_grid <= convecting_region_height
+    # the grid is increasing so the liquid and convecting ice regions are contiguous
+    # slices
+    ice_base = np.searchsorted(center_grid, -ice_depth, side="left")
+    convecting_top = np.searchsorted(
+        center_grid, convecting_region_height, side="right"
     )
-    is_liquid = center_grid < -ice_depth
+    is_convecting_ice = np.s_[ice_base:convecting_top]
+    is_liquid = np.s_[:ice_base]
 
     sink[is_convecting_ice] = brine_channel_strength
     sink[is_liquid] = 0
@@ -1,13 +1,13 @@
 from typing import Callable
-import numpy as np
 from numpy.typing import NDArray
 from .RJW14 import get_brine_convection_sink
 from .nucleation import get_nucleation
-from .flux import get_dz_fluxes
+from .flux import get_negative_dz_fluxes
 from .radiative_heating import get_radiative_heating
 from ..state import StateBCs
 from .velocities import calculate_velocities
 from ..params import Config
+from ..grids import Grids
 
 
 def _prevent_gas_rise_into_saturated_cell(
@@ -22,7 +22,7 @@ def _prevent_gas_rise_into_saturated_cell(
     the edge below. Make sure the very top boundary velocity is not changed as we want
     to always alow flux to the atmosphere regardless of the boundary conditions imposed.
 
-    :param Vg: gas insterstitial velocity on cell edges
+    :param Vg: gas insterstitial velocity on cell edges, modified in place
     :type Vg: Numpy array (size I+1)
     :param state_BCs: state of system with boundary conditions
     :type state_BCs: seaice3p.state.StateBCs
@@ -30,36 +30,48 @@ def _prevent_gas_rise_into_saturated_cell(
         fully gas saturated cell
 
     """
-    # Prevent gas rising into already gas saturated cell
-    gas_fraction_above = state_BCs.gas_fraction[1:]
-    solid_fraction_above = 1 - state_BCs.liquid_fraction[1:]
-    filtered_Vg = np.where(gas_fraction_above + solid_fraction_above >= 1, 0, Vg)
+    # Prevent gas rising into already gas saturated cell where
+    # gas_fraction + solid_fraction >= 1 with solid_fraction = 1 - liquid_fraction
+    is_saturated_above = state_BCs.gas_fraction[1:] >= state_BCs.liquid_fraction[1:]
+
+    # Vg is calculated fresh for each evaluation and not used elsewhere so it is
+    # filtered in place rather than copied.
+    top_boundary_Vg = Vg[-1]
+    Vg[is_saturated_above] = 0
 
     if cfg.bubble_params.escape_ice_surface:
         # Allow gas to leave top boundary
-        filtered_Vg[-1] = Vg[-1]
+        Vg[-1] = top_boundary_Vg
     else:
         # impermeable top boundary
-        filtered_Vg[-1] = 0
+        Vg[-1] = 0
 
-    return filtered_Vg
+    return Vg
 
 
-def get_equations(cfg: Config, grids) -> Callable[[StateBCs], NDArray]:
-    dz_fluxes = get_dz_fluxes(cfg, grids)
+def get_equations(cfg: Config, grids: Grids) -> Callable[[StateBCs], NDArray]:
+    negative_dz_fluxes = get_negative_dz_fluxes(cfg, grids)
     brine_convection_sink = get_brine_convection_sink(cfg, grids)
     nucleation = get_nucleation(cfg)
     radiative_heating = get_radiative_heating(cfg, grids)
 
     def equations(state_BCs: StateBCs) -> NDArray:
-        Vg, Wl, V = calculate_velocities(state_BCs, cfg)
+        Vg, Wl, V = calculate_velocities(state_BCs, cfg, grids)
         Vg = _prevent_gas_rise_into_saturated_cell(Vg, state_BCs, cfg)
 
-        return (
-            -dz_fluxes(state_BCs, Wl, Vg, V)
-            - brine_convection_sink(state_BCs)
-            + nucleation(state_BCs)
-            + radiative_heating(state_BCs)
-        )
+        # Accumulate all terms in place into the flux divergence array rather than
+        # allocating a new array for each operation. This array is created fresh on
+        # each call as the ODE solver keeps references to the returned arrays.
+        rhs = negative_dz_fluxes(state_BCs, Wl, Vg, V)
+
+        # brine convection sink terms are subtracted in place
+        brine_convection_sink(state_BCs, rhs)
+
+        # nucleation is added in place to the gas equations only
+        nucleation(state_BCs, rhs)
+
+        # shortwave heating is added in place to the enthalpy equation only
+        radiative_heating(state_BCs, rhs)
+        return rhs
 
     return equations
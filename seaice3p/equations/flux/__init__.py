@@ -1,4 +1,5 @@
 """Module for calculating the fluxes using upwind scheme"""
+
 from typing import Callable
 import numpy as np
 from numpy.typing import NDArray
@@ -11,46 +12,70 @@ from .gas_fraction_flux import calculate_gas_fraction_flux
 
 from ...state import StateBCs, EQMStateBCs, DISEQStateBCs
 from ...params import Config, EQMPhysicalParams, DISEQPhysicalParams
-from ...grids import Grids
+from ...grids import Grids, split_velocity
 
 
-def get_dz_fluxes(
+def get_negative_dz_fluxes(
     cfg: Config, grids: Grids
 ) -> Callable[[StateBCs, NDArray, NDArray, NDArray], NDArray]:
+    """Return function to calculate minus the vertical derivative of the flux of each
+    conserved quantity, which is the flux contribution to the right hand side of the
+    equations."""
     fun_map = {
-        EQMPhysicalParams: _EQM_dz_fluxes,
-        DISEQPhysicalParams: _DISEQ_dz_fluxes,
+        EQMPhysicalParams: _EQM_negative_dz_fluxes,
+        DISEQPhysicalParams: _DISEQ_negative_dz_fluxes,
     }
 
-    def dz_fluxes(state_BCs: StateBCs, Wl, Vg, V) -> NDArray:
-        return fun_map[type(cfg.physical_params)](state_BCs, Wl, Vg, V, cfg, grids)
-
-    return dz_fluxes
-
-
-def _EQM_dz_fluxes(state_BCs: EQMStateBCs, Wl, Vg, V, cfg, grids) -> NDArray:
-    D_g, D_e = grids.D_g, grids.D_e
-    dz = lambda flux: np.matmul(D_e, flux)
-    heat_flux = calculate_heat_flux(state_BCs, Wl, V, D_g, cfg)
-    salt_flux = calculate_salt_flux(state_BCs, Wl, V, D_g, cfg)
-    gas_flux = calculate_gas_flux(state_BCs, Wl, V, Vg, D_g, cfg)
-    return np.hstack((dz(heat_flux), dz(salt_flux), dz(gas_flux)))
-
-
-def _DISEQ_dz_fluxes(state_BCs: DISEQStateBCs, Wl, Vg, V, cfg, grids) -> NDArray:
-    D_g, D_e = grids.D_g, grids.D_e
-    dz = lambda flux: np.matmul(D_e, flux)
-    heat_flux = calculate_heat_flux(state_BCs, Wl, V, D_g, cfg)
-    salt_flux = calculate_salt_flux(state_BCs, Wl, V, D_g, cfg)
-    bulk_dissolved_gas_flux = calculate_bulk_dissolved_gas_flux(
-        state_BCs, Wl, V, D_g, cfg
-    )
-    gas_fraction_flux = calculate_gas_fraction_flux(state_BCs, V, Vg, D_g, cfg)
-    return np.hstack(
-        (
-            dz(heat_flux),
-            dz(salt_flux),
-            dz(bulk_dissolved_gas_flux),
-            dz(gas_fraction_flux),
+    calculate_negative_dz_fluxes = fun_map[type(cfg.physical_params)]
+
+    def negative_dz_fluxes(state_BCs: StateBCs, Wl, Vg, V) -> NDArray:
+        # split each velocity once as it is used to upwind several quantities
+        return calculate_negative_dz_fluxes(
+            state_BCs,
+            split_velocity(Wl),
+            split_velocity(Vg),
+            split_velocity(V),
+            cfg,
+            grids,
         )
-    )
+
+    return negative_dz_fluxes
+
+
+def _EQM_negative_dz_fluxes(state_BCs: EQMStateBCs, Wl, Vg, V, cfg, grids) -> NDArray:
+    step = grids.step
+    fluxes = np.empty((3, grids.edges.size))
+    fluxes[0] = calculate_heat_flux(state_BCs, Wl, V, step, cfg)
+    fluxes[1] = calculate_salt_flux(state_BCs, Wl, V, step, cfg)
+    fluxes[2] = calculate_gas_flux(state_BCs, Wl, V, Vg, step, cfg)
+    return _negative_dz_stacked_fluxes(fluxes, step)
+
+
+def _DISEQ_negative_dz_fluxes(
+    state_BCs: DISEQStateBCs, Wl, Vg, V, cfg, grids
+) -> NDArray:
+    step = grids.step
+    fluxes = np.empty((4, grids.edges.size))
+    fluxes[0] = calculate_heat_flux(state_BCs, Wl, V, step, cfg)
+    fluxes[1] = calculate_salt_flux(state_BCs, Wl, V, step, cfg)
+    fluxes[2] = calculate_bulk_dissolved_gas_flux(state_BCs, Wl, V, step, cfg)
+    fluxes[3] = calculate_gas_fraction_flux(state_BCs, V, Vg, step, cfg)
+    return _negative_dz_stacked_fluxes(fluxes, step)
+
+
+def _negative_dz_stacked_fluxes(fluxes: NDArray, step: float) -> NDArray:
+    """Take minus the vertical derivative of each row of fluxes on the edge grid
+
+    The differences are taken in reverse order so the sign comes for free rather than
+    needing another pass to negate the result.
+
+    :param fluxes: flux of each conserved quantity stored as a row on the edge grid
+    :type fluxes: Numpy Array of shape (number of quantities, I+1)
+    :param step: grid cell width
+    :type step: float
+    :return: negative derivatives of the fluxes on the center grid concatenated in the
+        order of the rows, as in the solution vector
+    """
+    negative_dz_fluxes = np.subtract(fluxes[:, :-1], fluxes[:, 1:])
+    negative_dz_fluxes /= step
+    return negative_dz_fluxes.ravel()
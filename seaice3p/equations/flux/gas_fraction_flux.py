@@ -8,12 +8,12 @@ from .bulk_gas_flux import (
 from ...params import Config
 
 
-def calculate_gas_fraction_flux(state_BCs, V, Vg, D_g, cfg: Config):
+def calculate_gas_fraction_flux(state_BCs, V, Vg, step, cfg: Config):
     gas_fraction = state_BCs.gas_fraction
     liquid_fraction = state_BCs.liquid_fraction
-    gas_fraction_flux = (
-        calculate_bubble_gas_flux(gas_fraction, Vg)
-        + calculate_frame_advection_gas_flux(gas_fraction, V)
-        + calculate_diffusive_gas_bubble_flux(gas_fraction, liquid_fraction, D_g, cfg)
+    gas_fraction_flux = calculate_bubble_gas_flux(gas_fraction, Vg)
+    gas_fraction_flux += calculate_frame_advection_gas_flux(gas_fraction, V)
+    gas_fraction_flux += calculate_diffusive_gas_bubble_flux(
+        gas_fraction, liquid_fraction, step, cfg
     )
     return gas_fraction_flux
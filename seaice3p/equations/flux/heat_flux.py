@@ -1,7 +1,7 @@
 import numpy as np
 from numpy.typing import NDArray
 
-from ...grids import upwind, geometric
+from ...grids import upwind, geometric, difference
 from ...params import Config, NoBrineConvection
 
 
@@ -15,35 +15,34 @@ def pure_liquid_switch(liquid_fraction: NDArray | float) -> NDArray | float:
 def calculate_conductivity(
     cfg: Config, solid_fraction: NDArray | float
 ) -> NDArray | float:
-    liquid_fraction = 1 - solid_fraction
-
+    # phi_l + lambda phi_s written in terms of the solid fraction alone
     return (
-        liquid_fraction
-        + cfg.physical_params.conductivity_ratio * solid_fraction
+        1
+        + (cfg.physical_params.conductivity_ratio - 1) * solid_fraction
         + cfg.physical_params.eddy_diffusivity_ratio
-        * pure_liquid_switch(liquid_fraction)
+        * pure_liquid_switch(1 - solid_fraction)
     )
 
 
-def calculate_conductive_heat_flux(state_BCs, D_g, cfg):
+def calculate_conductive_heat_flux(state_BCs, step, cfg):
     r"""Calculate conductive heat flux as
 
     .. math:: -[(\phi_l + \lambda \phi_s) \frac{\partial \theta}{\partial z}]
 
     :param temperature: temperature including ghost cells
     :type temperature: Numpy Array of size I+2
-    :param D_g: difference matrix for ghost grid
-    :type D_g: Numpy Array
+    :param step: grid cell width
+    :type step: float
     :param cfg: Simulation configuration
     :type cfg: seaice3p.params.Config
     :return: conductive heat flux
 
     """
     temperature = state_BCs.temperature
-    edge_liquid_fraction = geometric(state_BCs.liquid_fraction)
-    edge_solid_fraction = 1 - edge_liquid_fraction
+    edge_solid_fraction = geometric(state_BCs.liquid_fraction)
+    np.subtract(1, edge_solid_fraction, out=edge_solid_fraction)
     conductivity = calculate_conductivity(cfg, edge_solid_fraction)
-    return -conductivity * np.matmul(D_g, temperature)
+    return -conductivity * difference(temperature, step)
 
 
 def calculate_advective_heat_flux(temperature, liquid_fraction, Wl, cfg):
@@ -65,13 +64,11 @@ def calculate_frame_advection_heat_flux(enthalpy, V):
     return upwind(enthalpy, V)
 
 
-def calculate_heat_flux(state_BCs, Wl, V, D_g, cfg):
+def calculate_heat_flux(state_BCs, Wl, V, step, cfg):
     temperature = state_BCs.temperature
     liquid_fraction = state_BCs.liquid_fraction
     enthalpy = state_BCs.enthalpy
-    heat_flux = (
-        calculate_conductive_heat_flux(state_BCs, D_g, cfg)
-        + calculate_advective_heat_flux(temperature, liquid_fraction, Wl, cfg)
-        + calculate_frame_advection_heat_flux(enthalpy, V)
-    )
+    heat_flux = calculate_conductive_heat_flux(state_BCs, step, cfg)
+    heat_flux += calculate_advective_heat_flux(temperature, liquid_fraction, Wl, cfg)
+    heat_flux += calculate_frame_advection_heat_flux(enthalpy, V)
     return heat_flux
@@ -1,22 +1,25 @@
 import numpy as np
 
 from seaice3p.equations.flux.heat_flux import pure_liquid_switch
-from ...grids import upwind, geometric
+from ...grids import upwind, geometric, difference
 from ...params import Config
 
 
-def calculate_diffusive_salt_flux(liquid_salinity, liquid_fraction, D_g, cfg: Config):
+def calculate_diffusive_salt_flux(liquid_salinity, liquid_fraction, step, cfg: Config):
     """Take liquid salinity and liquid fraction on ghost grid and interpolate liquid
     fraction geometrically"""
     lewis_salt = cfg.physical_params.lewis_salt
     edge_liquid_fraction = geometric(liquid_fraction)
     # In pure liquid phase enhanced eddy diffusivity of dissolved salt
-    salt_diffusivity = edge_liquid_fraction * (
-        (1 / lewis_salt)
-        + cfg.physical_params.eddy_diffusivity_ratio
-        * pure_liquid_switch(edge_liquid_fraction)
-    )
-    return -salt_diffusivity * np.matmul(D_g, liquid_salinity)
+    # built up in place as phi_l (1 / Le + eddy diffusivity switch)
+    salt_diffusivity = pure_liquid_switch(edge_liquid_fraction)
+    salt_diffusivity *= cfg.physical_params.eddy_diffusivity_ratio
+    salt_diffusivity += 1 / lewis_salt
+    salt_diffusivity *= edge_liquid_fraction
+
+    diffusive_flux = difference(liquid_salinity, step)
+    diffusive_flux *= salt_diffusivity
+    return np.negative(diffusive_flux, out=diffusive_flux)
 
 
 def calculate_advective_salt_flux(liquid_salinity, Wl, cfg):
@@ -28,13 +31,13 @@ def calculate_frame_advection_salt_flux(salt, V):
     return upwind(salt, V)
 
 
-def calculate_salt_flux(state_BCs, Wl, V, D_g, cfg):
+def calculate_salt_flux(state_BCs, Wl, V, step, cfg):
     liquid_salinity = state_BCs.liquid_salinity
     liquid_fraction = state_BCs.liquid_fraction
     salt = state_BCs.salt
-    salt_flux = (
-        calculate_diffusive_salt_flux(liquid_salinity, liquid_fraction, D_g, cfg)
-        + calculate_advective_salt_flux(liquid_salinity, Wl, cfg)
-        + calculate_frame_advection_salt_flux(salt, V)
+    salt_flux = calculate_diffusive_salt_flux(
+        liquid_salinity, liquid_fraction, step, cfg
     )
+    salt_flux += calculate_advective_salt_flux(liquid_salinity, Wl, cfg)
+    salt_flux += calculate_frame_advection_salt_flux(salt, V)
     return salt_flux
@@ -6,27 +6,32 @@ from ..state import StateBCs, EQMStateBCs, DISEQStateBCs
 from ..params import Config, EQMPhysicalParams, DISEQPhysicalParams
 
 
-def get_nucleation(cfg: Config) -> Callable[[StateBCs], NDArray]:
+def get_nucleation(cfg: Config) -> Callable[[StateBCs, NDArray], None]:
+    """Return function to add the nucleation term in place to the right hand side of
+    the equations.
+
+    Only the DISEQ model has a nucleation term, in the bulk dissolved gas and gas
+    fraction equations, so the other parts of the right hand side are left untouched.
+    """
     fun_map = {
         EQMPhysicalParams: _EQM_nucleation,
         DISEQPhysicalParams: _DISEQ_nucleation,
     }
 
-    def nucleation(state_BCs: StateBCs) -> NDArray:
-        return fun_map[type(cfg.physical_params)](state_BCs, cfg)
+    add_nucleation = fun_map[type(cfg.physical_params)]
+
+    def nucleation(state_BCs: StateBCs, rhs: NDArray) -> None:
+        add_nucleation(state_BCs, cfg, rhs)
 
     return nucleation
 
 
-def _EQM_nucleation(state_BCs: EQMStateBCs, cfg: Config) -> NDArray:
-    """implement nucleation term"""
-    zeros = np.zeros_like(state_BCs.enthalpy[1:-1])
-    return np.hstack((zeros, zeros, zeros))
+def _EQM_nucleation(state_BCs: EQMStateBCs, cfg: Config, rhs: NDArray) -> None:
+    """no nucleation term in the EQM model"""
 
 
-def _DISEQ_nucleation(state_BCs: DISEQStateBCs, cfg: Config) -> NDArray:
+def _DISEQ_nucleation(state_BCs: DISEQStateBCs, cfg: Config, rhs: NDArray) -> None:
     """implement nucleation term"""
-    zeros = np.zeros_like(state_BCs.enthalpy[1:-1])
     chi = cfg.physical_params.expansion_coefficient
     Da = cfg.physical_params.damkohler_number
     centers = np.s_[1:-1]
@@ -35,18 +40,14 @@ def _DISEQ_nucleation(state_BCs: DISEQStateBCs, cfg: Config) -> NDArray:
     saturation = chi * liquid_fraction
     gas_fraction = state_BCs.gas_fraction[centers]
 
-    is_saturated = bulk_dissolved_gas > saturation
-    nucleation = np.full_like(bulk_dissolved_gas, np.nan)
-    nucleation[is_saturated] = Da * (
-        bulk_dissolved_gas[is_saturated] - saturation[is_saturated]
-    )
-    nucleation[~is_saturated] = -Da * gas_fraction[~is_saturated]
-
-    return np.hstack(
-        (
-            zeros,
-            zeros,
-            -nucleation,
-            nucleation,
-        )
+    # nucleate bubbles from supersaturated liquid or redissolve existing gas
+    nucleation = Da * np.where(
+        bulk_dissolved_gas > saturation,
+        bulk_dissolved_gas - saturation,
+        -gas_fraction,
     )
+
+    # views onto the parts of the right hand side for each equation
+    _, _, bulk_dissolved_gas_rhs, gas_fraction_rhs = np.split(rhs, 4)
+    bulk_dissolved_gas_rhs -= nucleation
+    gas_fraction_rhs += nucleation
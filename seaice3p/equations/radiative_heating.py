@@ -4,74 +4,107 @@ from typing import Callable
 import numpy as np
 from numpy.typing import NDArray
 import oilrad as oi
-from ..grids import Grids, average
-from ..params import (
-    Config,
-    EQMPhysicalParams,
-    DISEQPhysicalParams,
-    RadForcing,
-    ERA5Forcing,
-)
+from ..grids import Grids, average, difference
+from ..params import Config, RadForcing, ERA5Forcing
 from ..params.dimensional import (
     DimensionalBackgroundOilHeating,
     DimensionalMobileOilHeating,
     DimensionalNoHeating,
 )
 from ..forcing import get_SW_forcing
-from ..state import StateBCs, EQMStateBCs, DISEQStateBCs
+from ..state import StateBCs
 from ..oil_mass import convert_gas_fraction_to_oil_mass_ratio
 
 
-def get_radiative_heating(cfg: Config, grids: Grids) -> Callable[[StateBCs], NDArray]:
-    """Calculate internal shortwave heating source for enthalpy equation.
+def get_radiative_heating(
+    cfg: Config, grids: Grids
+) -> Callable[[StateBCs, NDArray], None]:
+    """Return function to add the internal shortwave heating source in place to the
+    enthalpy part of the right hand side (the first I entries for both the EQM and
+    DISEQ models).
 
     if the RadForcing object is given as the forcing config then calculates internal
     heating based on the object given in the configuration for oil_heating.
 
-    If another forcing is chosen then just returns a function to create an array of
-    zeros as no internal heating is calculated.
+    If another forcing is chosen, or there is no oil heating, then the returned
+    function does nothing as no internal heating is calculated. The heating is also
+    skipped whenever the incident shortwave is too small to be worth running the
+    two-stream model.
+
+    The heating is linear in the incident shortwave, so the two-stream model gives a
+    heating profile per unit incident shortwave which is scaled by the current
+    forcing. This profile only depends on the snow depth, liquid fraction and gas
+    fraction so the last one is reused when the solver evaluates the right hand side
+    again with these unchanged, for example when estimating the Jacobian for implicit
+    methods or between times when the snow depth is constant. The cached profile has
+    the heat flux scale folded in so it is multiplied directly by the incident
+    shortwave in W/m2.
     """
-    fun_map = {
-        EQMPhysicalParams: _EQM_radiative_heating,
-        DISEQPhysicalParams: _DISEQ_radiative_heating,
-    }
+    has_internal_heating = isinstance(
+        cfg.forcing_config, (RadForcing, ERA5Forcing)
+    ) and not isinstance(cfg.forcing_config.oil_heating, DimensionalNoHeating)
+
+    last_inputs = None
+    last_heating_profile = None
+
+    def radiative_heating(state_BCs: StateBCs, rhs: NDArray) -> None:
+        nonlocal last_inputs, last_heating_profile
+        if not has_internal_heating:
+            return
+
+        incident_SW_in_W_m2 = get_SW_forcing(state_BCs.time, cfg)
+        # If incident shortwave is small then optimize by not running the two-stream
+        # model
+        if incident_SW_in_W_m2 <= 0.5:
+            return
+
+        snow_depth = _get_snow_depth(state_BCs.time, cfg)
+        if not _heating_inputs_unchanged(last_inputs, snow_depth, state_BCs):
+            last_heating_profile = _calculate_shortwave_heating_profile(
+                state_BCs, cfg, grids, snow_depth
+            )
+            last_heating_profile /= cfg.scales.heat_flux_scale
+            last_inputs = (
+                snow_depth,
+                state_BCs.liquid_fraction.copy(),
+                state_BCs.gas_fraction.copy(),
+            )
 
-    def radiative_heating(state_BCs: StateBCs) -> NDArray:
-        return fun_map[type(cfg.physical_params)](state_BCs, cfg, grids)
+        enthalpy_rhs = rhs[: grids.number_of_cells]
+        enthalpy_rhs += incident_SW_in_W_m2 * last_heating_profile
 
     return radiative_heating
 
 
-def _EQM_radiative_heating(
-    state_BCs: EQMStateBCs, cfg: Config, grids: Grids
-) -> NDArray:
-    heating = _calculate_non_dimensional_shortwave_heating(state_BCs, cfg, grids)
-    return np.hstack(
-        (
-            heating,
-            np.zeros_like(heating),
-            np.zeros_like(heating),
-        )
+def _heating_inputs_unchanged(
+    last_inputs, snow_depth: float, state_BCs: StateBCs
+) -> bool:
+    """Check if the snow depth, liquid fraction and gas fraction are the same as
+    those the shortwave heating profile was last calculated for"""
+    if last_inputs is None:
+        return False
+    last_snow_depth, liquid_fraction, gas_fraction = last_inputs
+    return (
+        last_snow_depth == snow_depth
+        and np.array_equal(liquid_fraction, state_BCs.liquid_fraction)
+        and np.array_equal(gas_fraction, state_BCs.gas_fraction)
     )
 
 
-def _DISEQ_radiative_heating(
-    state_BCs: DISEQStateBCs, cfg: Config, grids: Grids
-) -> NDArray:
-    heating = _calculate_non_dimensional_shortwave_heating(state_BCs, cfg, grids)
-    return np.hstack(
-        (
-            heating,
-            np.zeros_like(heating),
-            np.zeros_like(heating),
-            np.zeros_like(heating),
-        )
-    )
+def _get_snow_depth(time: float, cfg: Config) -> float:
+    """Snow depth in meters, only the ERA5 forcing has a snow layer"""
+    if isinstance(cfg.forcing_config, ERA5Forcing):
+        return cfg.forcing_config.get_snow_depth(time)
+    return 0
 
 
 def run_two_stream_model(
-    state_bcs: StateBCs, cfg: Config, grids: Grids
+    state_bcs: StateBCs, cfg: Config, grids: Grids, snow_depth: float | None = None
 ) -> oi.SixBandSpectralIrradiance:
+    """Solve the two-stream model for the current ice state.
+
+    The snow depth is found from the forcing at the state time if not given.
+    """
 
     match cfg.forcing_config.oil_heating:
         case DimensionalBackgroundOilHeating():
@@ -94,10 +127,8 @@ def run_two_stream_model(
         case _:
             raise NotImplementedError()
 
-    if isinstance(cfg.forcing_config, ERA5Forcing):
-        snow_depth = cfg.forcing_config.get_snow_depth(state_bcs.time)
-    else:
-        snow_depth = 0
+    if snow_depth is None:
+        snow_depth = _get_snow_depth(state_bcs.time, cfg)
 
     if state_bcs.liquid_fraction[-2] < 1:
         SSL_depth = cfg.forcing_config.SW_forcing.SSL_depth
@@ -121,34 +152,15 @@ def run_two_stream_model(
     return oi.solve_two_stream_model(model)
 
 
-def _calculate_non_dimensional_shortwave_heating(
-    state_bcs: StateBCs, cfg: Config, grids: Grids
+def _calculate_shortwave_heating_profile(
+    state_bcs: StateBCs, cfg: Config, grids: Grids, snow_depth: float
 ) -> NDArray:
-    """Calculate internal shortwave heating due to oil droplets on center grid
-
-    Assumes a configuration with the RadForcing object as the forcing config is
-    passed."""
-    # If we don't have radiative forcing then just return array of zeros for heating
-    if not (
-        isinstance(cfg.forcing_config, RadForcing)
-        or isinstance(cfg.forcing_config, ERA5Forcing)
-    ):
-        return np.zeros_like(grids.centers)
-
-    if isinstance(cfg.forcing_config.oil_heating, DimensionalNoHeating):
-        return np.zeros_like(grids.centers)
-
-    incident_SW_in_W_m2 = get_SW_forcing(state_bcs.time, cfg)
-    # If incident shortwave is small then optimize by not running the two-stream model
-    if incident_SW_in_W_m2 <= 0.5:
-        return np.zeros_like(grids.centers)
-
-    dimensionless_incident_SW = cfg.scales.convert_from_dimensional_heat_flux(
-        incident_SW_in_W_m2
-    )
+    """Calculate internal shortwave heating due to oil droplets on center grid per
+    unit non dimensional incident shortwave
 
-    spectral_irradiances = run_two_stream_model(state_bcs, cfg, grids)
+    Assumes a configuration with the RadForcing or ERA5Forcing object as the forcing
+    config and oil heating is passed."""
+    spectral_irradiances = run_two_stream_model(state_bcs, cfg, grids, snow_depth)
     integrated_irradiance = oi.integrate_over_SW(spectral_irradiances)
 
-    dz_dF_net = grids.D_e @ integrated_irradiance.net_irradiance
-    return dimensionless_incident_SW * dz_dF_net
+    return difference(integrated_irradiance.net_irradiance, grids.step)
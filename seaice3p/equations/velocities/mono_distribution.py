@@ -16,13 +16,13 @@ def calculate_lag_function(bubble_size_fraction):
     for 0<lambda<1. Edge cases are given by G(0)=1 and G(1) = 0.5 for values outside
     this range.
     """
-    lag = np.full_like(bubble_size_fraction, np.nan)
     intermediate = (bubble_size_fraction < 1) & (bubble_size_fraction >= 0)
     large = bubble_size_fraction >= 1
-    lag[bubble_size_fraction < 0] = 1
-    lag[intermediate] = 1 - 0.5 * bubble_size_fraction[intermediate]
-    lag[large] = 0.5
-    return lag
+    return np.select(
+        [bubble_size_fraction < 0, intermediate, large],
+        [1.0, 1 - 0.5 * bubble_size_fraction, 0.5],
+        default=np.nan,
+    )
 
 
 def calculate_wall_drag_function(bubble_size_fraction, cfg: Config):
@@ -37,18 +37,25 @@ def calculate_wall_drag_function(bubble_size_fraction, cfg: Config):
     for 0<lambda<1. Edge cases are given by K(0)=1 and K(1) = 0 for values outside
     this range.
     """
-    drag = np.full_like(bubble_size_fraction, np.nan)
     intermediate = (bubble_size_fraction < 1) & (bubble_size_fraction >= 0)
     large = bubble_size_fraction >= 1
-    drag[bubble_size_fraction < 0] = 1
-    drag[intermediate] = (
-        1
-        - 1.5 * bubble_size_fraction[intermediate]
-        + 1.5 * bubble_size_fraction[intermediate] ** 5
-        - bubble_size_fraction[intermediate] ** 6
-    ) / (1 + 1.5 * bubble_size_fraction[intermediate] ** 5)
-    drag[large] = 0
-    return drag
+
+    # evaluate the Haberman function everywhere, forming the powers of lambda by
+    # repeated multiplication, and select it for 0<lambda<1. Overflow is ignored as
+    # it can only occur for large bubble size fractions where it is not used.
+    lam = bubble_size_fraction
+    with np.errstate(over="ignore", invalid="ignore"):
+        lam_squared = lam * lam
+        lam_fifth = lam_squared * lam_squared * lam
+        haberman = (1 - 1.5 * lam + 1.5 * lam_fifth - lam_fifth * lam) / (
+            1 + 1.5 * lam_fifth
+        )
+
+    return np.select(
+        [bubble_size_fraction < 0, intermediate, large],
+        [1.0, haberman, 0.0],
+        default=np.nan,
+    )
 
 
 def calculate_mono_wall_drag_factor(liquid_fraction, cfg: Config):
@@ -64,7 +71,7 @@ def calculate_mono_wall_drag_factor(liquid_fraction, cfg: Config):
         bubble_radius_scaled, geometric(liquid_fraction), cfg
     )
     drag_function = calculate_wall_drag_function(bubble_size_fraction, cfg)
-    drag_factor = drag_function * bubble_size_fraction**2
+    drag_factor = drag_function * bubble_size_fraction * bubble_size_fraction
     return drag_factor
 
 
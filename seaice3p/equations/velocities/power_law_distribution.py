@@ -23,14 +23,15 @@ def calculate_wall_drag_integrand(bubble_size_fraction: float, cfg: Config):
     if bubble_size_fraction < 0:
         return 0
     elif (bubble_size_fraction >= 0) and (bubble_size_fraction < 1):
+        lam_fifth = bubble_size_fraction**5
         return (
             (
                 1
                 - 1.5 * bubble_size_fraction
-                + 1.5 * bubble_size_fraction**5
-                - bubble_size_fraction**6
+                + 1.5 * lam_fifth
+                - lam_fifth * bubble_size_fraction
             )
-            / (1 + 1.5 * bubble_size_fraction**5)
+            / (1 + 1.5 * lam_fifth)
         ) * (bubble_size_fraction ** (5 - power_law))
     else:
         return 0
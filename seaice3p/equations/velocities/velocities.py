@@ -16,6 +16,16 @@ from .power_law_distribution import (
     calculate_power_law_lag_factor,
 )
 
+# wall drag and lag factor functions for each bubble size distribution, built once on
+# import to dispatch on the type of bubble parameters
+_BUBBLE_FACTORS = {
+    MonoBubbleParams: (calculate_mono_wall_drag_factor, calculate_mono_lag_factor),
+    PowerLawBubbleParams: (
+        calculate_power_law_wall_drag_factor,
+        calculate_power_law_lag_factor,
+    ),
+}
+
 
 def calculate_frame_velocity(cfg: Config):
     return np.full((cfg.numerical_params.I + 1,), cfg.physical_params.frame_velocity)
@@ -65,9 +75,11 @@ def calculate_gas_interstitial_velocity(
     B = cfg.bubble_params.B
     exponent = cfg.bubble_params.pore_throat_scaling
 
+    edge_liquid_fraction = geometric(liquid_fraction)
+
     REGULARISATION = 1e-10
     liquid_interstitial_velocity = (
-        liquid_darcy_velocity * 2 / (geometric(liquid_fraction) + REGULARISATION)
+        liquid_darcy_velocity * 2 / (edge_liquid_fraction + REGULARISATION)
     )
 
     viscosity_factor = (
@@ -76,47 +88,41 @@ def calculate_gas_interstitial_velocity(
         / (2 + 3 * cfg.physical_params.gas_viscosity_ratio)
     )
     Vg = (
-        viscosity_factor
-        * B
-        * wall_drag_factor
-        * geometric(liquid_fraction) ** (2 * exponent)
+        viscosity_factor * B * wall_drag_factor * edge_liquid_fraction ** (2 * exponent)
         + liquid_interstitial_velocity * lag_factor
     )
 
     # apply a porosity cutoff to the gas interstitial velocity if necking occurs below
     # critical porosity.
     if cfg.bubble_params.porosity_threshold:
-        return Vg * np.heaviside(
-            geometric(liquid_fraction) - cfg.bubble_params.porosity_threshold_value,
-            0,
+        Vg *= np.heaviside(
+            edge_liquid_fraction - cfg.bubble_params.porosity_threshold_value, 0
         )
 
     return Vg
 
 
-def calculate_velocities(state_BCs, cfg: Config):
+def calculate_velocities(state_BCs, cfg: Config, grids: Grids):
     """Inputs on ghost grid, outputs on edge grid
 
     needs the simulation config, liquid fraction, liquid salinity and grids
+
+    The grids are passed in so they are built once for the simulation rather than on
+    every call.
     """
     liquid_fraction = state_BCs.liquid_fraction
     liquid_salinity = state_BCs.liquid_salinity
-    center_grid, edge_grid = (
-        Grids(cfg.numerical_params.I).centers,
-        Grids(cfg.numerical_params.I).edges,
-    )
-
-    match cfg.bubble_params:
-        case MonoBubbleParams():
-            wall_drag_factor = calculate_mono_wall_drag_factor(liquid_fraction, cfg)
-            lag_factor = calculate_mono_lag_factor(liquid_fraction, cfg)
-        case PowerLawBubbleParams():
-            wall_drag_factor = calculate_power_law_wall_drag_factor(
-                liquid_fraction, cfg
-            )
-            lag_factor = calculate_power_law_lag_factor(liquid_fraction, cfg)
-        case _:
-            raise NotImplementedError
+    center_grid, edge_grid = grids.centers, grids.edges
+
+    params_type = type(cfg.bubble_params)
+    try:
+        calculate_wall_drag_factor, calculate_lag_factor = _BUBBLE_FACTORS[params_type]
+    except KeyError:
+        raise NotImplementedError(
+            f"No bubble parameters implemented for {params_type.__name__}"
+        ) from None
+    wall_drag_factor = calculate_wall_drag_factor(liquid_fraction, cfg)
+    lag_factor = calculate_lag_factor(liquid_fraction, cfg)
 
     # check if we want to couple the bubble to fluid motion in the vertical
     if not isinstance(cfg.brine_convection_params, NoBrineConvection):
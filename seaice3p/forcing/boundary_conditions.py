@@ -4,6 +4,7 @@ centered grid that needs to be on the ghost grid for the upwind scheme.
 
 from typing import Callable
 import numpy as np
+from numpy.typing import NDArray
 
 from .temperature_forcing import get_temperature_forcing, get_bottom_temperature_forcing
 from ..grids import add_ghost_cells
@@ -29,24 +30,40 @@ def get_boundary_conditions(cfg: Config) -> Callable[[StateFull], StateBCs]:
         DISEQPhysicalParams: _DISEQ_boundary_conditions,
     }
 
+    add_boundary_conditions = fun_map[type(cfg.physical_params)]
+
     def boundary_conditions(full_state: StateFull) -> StateBCs:
-        return fun_map[type(cfg.physical_params)](full_state, cfg)
+        return add_boundary_conditions(full_state, cfg)
 
     return boundary_conditions
 
 
 def _EQM_boundary_conditions(full_state: EQMStateFull, cfg: Config) -> StateBCs:
     time = full_state.time
-    temperature = _temperature_BCs(full_state, cfg)
-    enthalpy = _enthalpy_BCs(full_state.enthalpy, cfg, temperature[0])
-    salt = _salt_BCs(full_state.salt, cfg)
 
-    liquid_salinity = _liquid_salinity_BCs(full_state.liquid_salinity, cfg)
-    dissolved_gas = _dissolved_gas_BCs(full_state.dissolved_gas, cfg)
-    gas_fraction = _gas_fraction_BCs(full_state.gas_fraction, cfg)
-    liquid_fraction = _liquid_fraction_BCs(full_state.liquid_fraction)
+    # Store all quantities on the ghost grid contiguously as rows of one block
+    # ordered as the fields of EQMStateBCs
+    (
+        enthalpy,
+        salt,
+        gas,
+        temperature,
+        liquid_salinity,
+        dissolved_gas,
+        gas_fraction,
+        liquid_fraction,
+    ) = _allocate_ghost_block(8, full_state)
+
+    _temperature_BCs(full_state, cfg, out=temperature)
+    _enthalpy_BCs(full_state.enthalpy, cfg, temperature[0], out=enthalpy)
+    _salt_BCs(full_state.salt, cfg, out=salt)
+
+    _liquid_salinity_BCs(full_state.liquid_salinity, cfg, out=liquid_salinity)
+    _dissolved_gas_BCs(full_state.dissolved_gas, cfg, out=dissolved_gas)
+    _gas_fraction_BCs(full_state.gas_fraction, cfg, out=gas_fraction)
+    _liquid_fraction_BCs(full_state.liquid_fraction, out=liquid_fraction)
 
-    gas = _gas_BCs(full_state.gas, cfg)
+    _gas_BCs(full_state.gas, cfg, out=gas)
     return EQMStateBCs(
         time,
         enthalpy,
@@ -62,17 +79,33 @@ def _EQM_boundary_conditions(full_state: EQMStateFull, cfg: Config) -> StateBCs:
 
 def _DISEQ_boundary_conditions(full_state: DISEQStateFull, cfg: Config) -> StateBCs:
     time = full_state.time
-    temperature = _temperature_BCs(full_state, cfg)
-    enthalpy = _enthalpy_BCs(full_state.enthalpy, cfg, temperature[0])
-    salt = _salt_BCs(full_state.salt, cfg)
 
-    liquid_salinity = _liquid_salinity_BCs(full_state.liquid_salinity, cfg)
-    dissolved_gas = _dissolved_gas_BCs(full_state.dissolved_gas, cfg)
-    gas_fraction = _gas_fraction_BCs(full_state.gas_fraction, cfg)
-    liquid_fraction = _liquid_fraction_BCs(full_state.liquid_fraction)
+    # Store all quantities on the ghost grid contiguously as rows of one block
+    # ordered as the fields of DISEQStateBCs
+    (
+        enthalpy,
+        salt,
+        temperature,
+        liquid_salinity,
+        dissolved_gas,
+        liquid_fraction,
+        bulk_dissolved_gas,
+        gas_fraction,
+    ) = _allocate_ghost_block(8, full_state)
+
+    _temperature_BCs(full_state, cfg, out=temperature)
+    _enthalpy_BCs(full_state.enthalpy, cfg, temperature[0], out=enthalpy)
+    _salt_BCs(full_state.salt, cfg, out=salt)
+
+    _liquid_salinity_BCs(full_state.liquid_salinity, cfg, out=liquid_salinity)
+    _dissolved_gas_BCs(full_state.dissolved_gas, cfg, out=dissolved_gas)
+    _gas_fraction_BCs(full_state.gas_fraction, cfg, out=gas_fraction)
+    _liquid_fraction_BCs(full_state.liquid_fraction, out=liquid_fraction)
 
-    bulk_dissolved_gas = (
-        cfg.physical_params.expansion_coefficient * liquid_fraction * dissolved_gas
+    np.multiply(
+        cfg.physical_params.expansion_coefficient * liquid_fraction,
+        dissolved_gas,
+        out=bulk_dissolved_gas,
     )
     return DISEQStateBCs(
         time,
@@ -87,67 +120,77 @@ def _DISEQ_boundary_conditions(full_state: DISEQStateFull, cfg: Config) -> State
     )
 
 
-def _dissolved_gas_BCs(dissolved_gas_centers, cfg: Config):
+def _allocate_ghost_block(number_of_fields: int, full_state: StateFull) -> NDArray:
+    """Return an uninitialised array with a row on the ghost grid for each field"""
+    return np.empty((number_of_fields, full_state.enthalpy.size + 2))
+
+
+def _dissolved_gas_BCs(dissolved_gas_centers, cfg: Config, out=None):
     """Add ghost cells with BCs to center quantity"""
     return add_ghost_cells(
-        dissolved_gas_centers, bottom=cfg.ocean_forcing_config.ocean_gas_sat, top=1
+        dissolved_gas_centers,
+        bottom=cfg.ocean_forcing_config.ocean_gas_sat,
+        top=1,
+        out=out,
     )
 
 
-def _gas_fraction_BCs(gas_fraction_centers, cfg: Config):
+def _gas_fraction_BCs(gas_fraction_centers, cfg: Config, out=None):
     """Add ghost cells with BCs to center quantity"""
     if isinstance(cfg.initial_conditions_config, OilInitialConditions):
         return add_ghost_cells(
             gas_fraction_centers,
             bottom=cfg.initial_conditions_config.initial_oil_volume_fraction,
             top=0,
+            out=out,
         )
     else:
         return add_ghost_cells(
-            gas_fraction_centers, bottom=gas_fraction_centers[0], top=0
+            gas_fraction_centers, bottom=gas_fraction_centers[0], top=0, out=out
         )
 
 
-def _gas_BCs(gas_centers, cfg: Config):
+def _gas_BCs(gas_centers, cfg: Config, out=None):
     """Add ghost cells with BCs to center quantity"""
     chi = cfg.physical_params.expansion_coefficient
     far_gas_sat = cfg.ocean_forcing_config.ocean_gas_sat
-    return add_ghost_cells(gas_centers, bottom=chi * far_gas_sat, top=chi)
+    return add_ghost_cells(gas_centers, bottom=chi * far_gas_sat, top=chi, out=out)
 
 
-def _liquid_salinity_BCs(liquid_salinity_centers, cfg: Config):
+def _liquid_salinity_BCs(liquid_salinity_centers, cfg: Config, out=None):
     """Add ghost cells with BCs to center quantity"""
     return add_ghost_cells(
-        liquid_salinity_centers, bottom=0, top=liquid_salinity_centers[-1]
+        liquid_salinity_centers, bottom=0, top=liquid_salinity_centers[-1], out=out
     )
 
 
-def _temperature_BCs(state: StateFull, cfg: Config):
+def _temperature_BCs(state: StateFull, cfg: Config, out=None):
     """Add ghost cells with BCs to center quantity
 
     Note this needs the current time as well as top temperature is forced."""
     far_temp = get_bottom_temperature_forcing(state, cfg)
     top_temp = get_temperature_forcing(state, cfg)
-    return add_ghost_cells(state.temperature, bottom=far_temp, top=top_temp)
+    return add_ghost_cells(state.temperature, bottom=far_temp, top=top_temp, out=out)
 
 
-def _enthalpy_BCs(enthalpy_centers, cfg: Config, bottom_temperature):
+def _enthalpy_BCs(enthalpy_centers, cfg: Config, bottom_temperature, out=None):
     """Add ghost cells with BCs to center quantity"""
     return add_ghost_cells(
-        enthalpy_centers, bottom=bottom_temperature, top=enthalpy_centers[-1]
+        enthalpy_centers, bottom=bottom_temperature, top=enthalpy_centers[-1], out=out
     )
 
 
-def _salt_BCs(salt_centers, cfg: Config):
+def _salt_BCs(salt_centers, cfg: Config, out=None):
     """Add ghost cells with BCs to center quantity"""
-    return add_ghost_cells(salt_centers, bottom=0, top=salt_centers[-1])
+    return add_ghost_cells(salt_centers, bottom=0, top=salt_centers[-1], out=out)
 
 
-def _liquid_fraction_BCs(liquid_fraction_centers):
+def _liquid_fraction_BCs(liquid_fraction_centers, out=None):
     """Add ghost cells to liquid fraction such that top and bottom boundaries take the
     same value as the top and bottom cell center"""
     return add_ghost_cells(
         liquid_fraction_centers,
         bottom=liquid_fraction_centers[0],
         top=liquid_fraction_centers[-1],
+        out=out,
     )
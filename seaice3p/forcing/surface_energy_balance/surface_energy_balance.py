@@ -44,9 +44,11 @@ def _calculate_total_heat_flux(
     top_cell_conductivity: float,
 ) -> float:
     """Takes non-dimensional surface temperature and returns non-dimensional heat flux"""
+    # called for every iteration of the surface temperature root find
+    scales = cfg.scales
     if isinstance(cfg.forcing_config, ERA5Forcing):
         dimensional_temperature_gradient = (
-            cfg.scales.temperature_difference * temp_gradient / cfg.scales.lengthscale
+            scales.temperature_difference * temp_gradient / scales.lengthscale
         )
         surface_temp_K = (
             _convert_non_dim_temperature_to_kelvin(cfg, surface_temp)
@@ -63,7 +65,7 @@ def _calculate_total_heat_flux(
         + calculate_sensible_heat_flux(cfg, time, top_cell_is_ice, surface_temp_K)
         + calculate_latent_heat_flux(cfg, time, top_cell_is_ice, surface_temp_K)
     )
-    return cfg.scales.convert_from_dimensional_heat_flux(dimensional_heat_flux)
+    return scales.convert_from_dimensional_heat_flux(dimensional_heat_flux)
 
 
 def find_ghost_cell_temperature(state: StateFull, cfg: Config) -> float:
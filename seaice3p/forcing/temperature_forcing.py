@@ -27,25 +27,11 @@ from ..equations.flux.heat_flux import calculate_conductivity
 
 
 def get_temperature_forcing(state: StateFull, cfg: Config):
-    TEMPERATURE_FORCINGS = {
-        ConstantForcing: _constant_temperature_forcing,
-        YearlyForcing: _yearly_temperature_forcing,
-        BRW09Forcing: _barrow_temperature_forcing,
-        RadForcing: find_ghost_cell_temperature,
-        ERA5Forcing: find_ghost_cell_temperature,
-        RobinForcing: _Robin_forcing,
-    }
-    return TEMPERATURE_FORCINGS[type(cfg.forcing_config)](state, cfg)
+    return _TEMPERATURE_FORCINGS[type(cfg.forcing_config)](state, cfg)
 
 
 def get_bottom_temperature_forcing(state: StateFull, cfg: Config):
-    OCEAN_TEMPERATURE_FORCINGS = {
-        FixedTempOceanForcing: _constant_ocean_temperature_forcing,
-        BRW09OceanForcing: _barrow_ocean_temperature_forcing,
-        FixedHeatFluxOceanForcing: _constant_ocean_heat_flux_ghost_temperature,
-        MonthlyHeatFluxOceanForcing: _constant_ocean_heat_flux_ghost_temperature,
-    }
-    return OCEAN_TEMPERATURE_FORCINGS[type(cfg.ocean_forcing_config)](state, cfg)
+    return _OCEAN_TEMPERATURE_FORCINGS[type(cfg.ocean_forcing_config)](state, cfg)
 
 
 def _constant_temperature_forcing(state: StateFull, cfg: Config):
@@ -54,18 +40,16 @@ def _constant_temperature_forcing(state: StateFull, cfg: Config):
 
 def _yearly_temperature_forcing(state: StateFull, cfg: Config):
     amplitude = cfg.forcing_config.amplitude
-    period = cfg.forcing_config.period
+    angular_frequency = cfg.forcing_config.angular_frequency
     offset = cfg.forcing_config.offset
-    return amplitude * (np.cos(state.time * 2 * np.pi / period) + offset)
+    return amplitude * (np.cos(state.time * angular_frequency) + offset)
 
 
 def _dimensional_barrow_temperature_forcing(time_in_days, cfg: Config):
     """Take time in days and linearly interp 2009 Barrow air/snow/ice temperature data to get
     temperature in degrees Celsius.
     """
-    barrow_days = cfg.forcing_config.barrow_days
-    barrow_top_temp = cfg.forcing_config.barrow_top_temp
-    return np.interp(time_in_days, barrow_days, barrow_top_temp, right=np.nan)
+    return cfg.forcing_config.get_barrow_top_temp(time_in_days)
 
 
 def _barrow_temperature_forcing(state: StateFull, cfg: Config):
@@ -113,9 +97,7 @@ def _dimensional_barrow_ocean_temperature_forcing(
     """Take time in days and linearly interp 2009 Barrow ocean temperature data to get
     temperature in degrees Celsius.
     """
-    barrow_ocean_days = cfg.ocean_forcing_config.barrow_ocean_days
-    barrow_bottom_temp = cfg.ocean_forcing_config.barrow_bottom_temp
-    return np.interp(time_in_days, barrow_ocean_days, barrow_bottom_temp, right=np.nan)
+    return cfg.ocean_forcing_config.get_barrow_bottom_temp(time_in_days)
 
 
 def _barrow_ocean_temperature_forcing(state: StateFull, cfg: Config) -> float:
@@ -147,3 +129,22 @@ def _constant_ocean_heat_flux_ghost_temperature(state: StateFull, cfg: Config) -
     return state.temperature[0] + (
         (ocean_heat_flux * cfg.numerical_params.step) / conductivity
     )
+
+
+# Dispatch tables are built once on import rather than on every call as the forcing
+# is evaluated at every timestep
+_TEMPERATURE_FORCINGS = {
+    ConstantForcing: _constant_temperature_forcing,
+    YearlyForcing: _yearly_temperature_forcing,
+    BRW09Forcing: _barrow_temperature_forcing,
+    RadForcing: find_ghost_cell_temperature,
+    ERA5Forcing: find_ghost_cell_temperature,
+    RobinForcing: _Robin_forcing,
+}
+
+_OCEAN_TEMPERATURE_FORCINGS = {
+    FixedTempOceanForcing: _constant_ocean_temperature_forcing,
+    BRW09OceanForcing: _barrow_ocean_temperature_forcing,
+    FixedHeatFluxOceanForcing: _constant_ocean_heat_flux_ghost_temperature,
+    MonthlyHeatFluxOceanForcing: _constant_ocean_heat_flux_ghost_temperature,
+}
@@ -33,14 +33,12 @@ class Grids:
     @cached_property
     def centers(self) -> NDArray:
         """Center grid"""
-        return np.array(
-            [-1 + (2 * i + 1) * self.step / 2 for i in range(self.number_of_cells)]
-        )
+        return -1 + (2 * np.arange(self.number_of_cells) + 1) * self.step / 2
 
     @cached_property
     def edges(self) -> NDArray:
         """Edge grid"""
-        return np.array([-1 + i * self.step for i in range(self.number_of_cells + 1)])
+        return -1 + np.arange(self.number_of_cells + 1) * self.step
 
     @cached_property
     def ghosts(self) -> NDArray:
@@ -51,21 +49,45 @@ class Grids:
 
     @cached_property
     def D_e(self) -> NDArray:
-        """Difference matrix to differentiate edge grid quantities to the center grid"""
+        """Difference matrix to differentiate edge grid quantities to the center grid
+
+        This is a dense matrix so the difference function should be preferred to
+        multiplying by it.
+        """
         return get_difference_matrix(self.number_of_cells, self.step)
 
     @cached_property
     def D_g(self) -> NDArray:
-        """Difference matrix to differentiate ghost grid quantities to the edge grid"""
+        """Difference matrix to differentiate ghost grid quantities to the edge grid
+
+        This is a dense matrix so the difference function should be preferred to
+        multiplying by it.
+        """
         return get_difference_matrix(self.number_of_cells + 1, self.step)
 
 
-def upwind(ghosts, velocity):
+@dataclass(frozen=True)
+class SplitVelocity:
+    """Upwards and downwards parts of a velocity on the edge grid for the upwind
+    scheme.
+
+    Split once so the same velocity can upwind several quantities.
+    """
+
+    upwards: NDArray
+    downwards: NDArray
+
+
+def split_velocity(velocity: NDArray) -> SplitVelocity:
+    """Split a velocity on the edge grid into its upwards and downwards parts"""
+    return SplitVelocity(np.maximum(velocity, 0), np.minimum(velocity, 0))
+
+
+def upwind(ghosts, velocity: SplitVelocity):
     upper_ghosts = ghosts[1:]
     lower_ghosts = ghosts[:-1]
-    upwards = np.maximum(velocity, 0)
-    downwards = np.minimum(velocity, 0)
-    edges = upwards * lower_ghosts + downwards * upper_ghosts
+    edges = velocity.upwards * lower_ghosts
+    edges += velocity.downwards * upper_ghosts
     return edges
 
 
@@ -86,7 +108,23 @@ def average(points: NDArray) -> NDArray:
     return 0.5 * (upper + lower)
 
 
-def add_ghost_cells(centers, bottom, top):
+def difference(points: NDArray, step: float) -> NDArray:
+    """Returns the finite difference of adjacent points in an array divided by the
+    grid cell width
+
+    takes ghosts -> edges -> centers and is equivalent to multiplying by the
+    difference matrices D_g and D_e without the dense matrix product.
+
+    The division is done in place so only the output array is allocated.
+    """
+    upper = points[1:]
+    lower = points[:-1]
+    differences = np.subtract(upper, lower)
+    differences /= step
+    return differences
+
+
+def add_ghost_cells(centers, bottom, top, out=None):
     """Add specified bottom and top value to center grid
 
     :param centers: numpy array on centered grid (size I).
@@ -95,9 +133,16 @@ def add_ghost_cells(centers, bottom, top):
     :type bottom: float
     :param top: top value placed at index -1.
     :type top: float
+    :param out: optional array on ghost grid (size I+2) to write the output into.
+    :type out: Numpy array
     :return: numpy array on ghost grid (size I+2).
     """
-    return np.concatenate((np.array([bottom]), centers, np.array([top])))
+    if out is None:
+        out = np.empty(centers.size + 2)
+    out[0] = bottom
+    out[1:-1] = centers
+    out[-1] = top
+    return out
 
 
 def calculate_ice_ocean_boundary_depth(liquid_fraction, edge_grid):
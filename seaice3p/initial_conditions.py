@@ -1,6 +1,7 @@
 """Module to provide initial state of bulk enthalpy, bulk salinity and bulk gas for the
 simulation.
 """
+from functools import lru_cache
 import numpy as np
 
 from .params import (
@@ -18,17 +19,25 @@ from .grids import Grids
 
 
 def get_initial_conditions(cfg: Config):
-    INITIAL_CONDITIONS = {
-        UniformInitialConditions: _get_uniform_initial_conditions,
-        BRW09InitialConditions: _get_barrow_initial_conditions,
-        OilInitialConditions: _get_oil_initial_conditions,
-        PreviousSimulation: _get_previous_simulation_final_state,
-    }
-    initial_state = INITIAL_CONDITIONS[type(cfg.initial_conditions_config)](cfg)
+    """Return the initial solution vector with the fields in solver order.
+
+    The vector is always double precision. solve_ivp casts the initial values to
+    float64 and integrates in it, so storing the fields in lower precision would only
+    lose accuracy and force a cast.
+    """
+    config_type = type(cfg.initial_conditions_config)
+    try:
+        get_initial_state = _INITIAL_CONDITIONS[config_type]
+    except KeyError:
+        raise NotImplementedError(
+            f"No initial conditions implemented for {config_type.__name__}"
+        ) from None
+    initial_state = get_initial_state(cfg)
     match cfg.physical_params:
         case EQMPhysicalParams():
             return np.hstack(
-                (initial_state.enthalpy, initial_state.salt, initial_state.gas)
+                (initial_state.enthalpy, initial_state.salt, initial_state.gas),
+                dtype=np.float64,
             )
         case DISEQPhysicalParams():
             return np.hstack(
@@ -37,12 +46,30 @@ def get_initial_conditions(cfg: Config):
                     initial_state.salt,
                     initial_state.bulk_dissolved_gas,
                     initial_state.gas_fraction,
-                )
+                ),
+                dtype=np.float64,
             )
         case _:
             raise NotImplementedError
 
 
+@lru_cache(maxsize=16)
+def _get_centers(number_of_cells: int):
+    """Center grid shared by the initial condition builders for each grid size.
+
+    Cached so that repeatedly generating initial conditions, for example when setting
+    up a batch of simulations, does not rebuild the grid. The array is read only so
+    the cached entry cannot be modified.
+
+    Grids computes its arrays lazily so only the centers are built here, and they are
+    exactly the centers used by the solver. The Grids instance is discarded so its
+    array is cached directly without a copy.
+    """
+    centers = Grids(number_of_cells).centers
+    centers.setflags(write=False)
+    return centers
+
+
 def _apply_value_in_ice_layer(depth_of_ice, ice_value, liquid_value, grid):
     """assume that top part of domain contains mushy ice of given depth and lower part
     of domain is liquid. This function returns output on the given grid where the ice
@@ -50,11 +77,38 @@ def _apply_value_in_ice_layer(depth_of_ice, ice_value, liquid_value, grid):
 
     This is useful for initialising the barrow simulation where we have an initial ice
     layer.
+
+    The grid is increasing so the ice is the contiguous part of the grid above the
+    index found by bisection and the two values are written as slices.
+
+    Several fields sharing the same ice layer can be filled at once by passing
+    sequences of values. The output is then one block with a row per field.
     """
-    output = np.where(grid > -depth_of_ice, ice_value, liquid_value)
+    ice_value = np.asarray(ice_value)[..., np.newaxis]
+    liquid_value = np.asarray(liquid_value)[..., np.newaxis]
+    boundary = np.searchsorted(grid, -depth_of_ice, side="right")
+    output = np.empty(
+        np.broadcast_shapes(ice_value.shape, liquid_value.shape, grid.shape),
+        dtype=np.result_type(ice_value, liquid_value, grid),
+    )
+    output[..., :boundary] = liquid_value
+    output[..., boundary:] = ice_value
     return output
 
 
+def _calculate_mushy_enthalpy(salt, temperature, cfg: Config):
+    """Invert the temperature relation in the mushy layer to find the enthalpy.
+
+    The ice layer initial conditions have a constant salt and temperature so this is
+    evaluated once with scalars rather than over the whole grid.
+    """
+    physical_params = cfg.physical_params
+    solid_fraction_in_mush = (salt + temperature) / (
+        temperature - physical_params.concentration_ratio
+    )
+    return temperature - solid_fraction_in_mush * physical_params.stefan_number
+
+
 def _get_previous_simulation_final_state(cfg: Config):
     """Generate initial state from the final state of a saved simulation
 
@@ -99,10 +153,12 @@ def _get_uniform_initial_conditions(cfg: Config):
     bottom_dissolved_gas = cfg.ocean_forcing_config.ocean_gas_sat
     bottom_bulk_gas = bottom_dissolved_gas * chi
 
-    # Initialise uniform enthalpy assuming completely liquid initial domain
-    enthalpy = np.full((cfg.numerical_params.I,), bottom_temp)
-    salt = np.full_like(enthalpy, bottom_bulk_salinity)
-    gas = np.full_like(enthalpy, bottom_bulk_gas)
+    # Initialise uniform enthalpy assuming completely liquid initial domain.
+    # Store the fields as rows of one block in the order of the solution vector.
+    enthalpy, salt, gas = np.empty((3, cfg.numerical_params.I))
+    enthalpy[:] = bottom_temp
+    salt[:] = bottom_bulk_salinity
+    gas[:] = bottom_bulk_gas
 
     return _pack_initial_state(cfg, enthalpy, salt, gas)
 
@@ -119,42 +175,31 @@ def _get_barrow_initial_conditions(cfg: Config):
     Ice temperature is given as -8.15 degC and ocean is the far value from boundary
     config.
     """
+    scales = cfg.scales
     far_gas_sat = cfg.ocean_forcing_config.ocean_gas_sat
-    ICE_DEPTH = cfg.scales.convert_from_dimensional_grid(0.7)
+    ICE_DEPTH = scales.convert_from_dimensional_grid(0.7)
 
     # if we are going to have brine convection ice will desalinate on its own
     if not isinstance(cfg.brine_convection_params, NoBrineConvection):
         SALT_IN_ICE = 0
     else:
-        SALT_IN_ICE = cfg.scales.convert_from_dimensional_bulk_salinity(5.92)
+        SALT_IN_ICE = scales.convert_from_dimensional_bulk_salinity(5.92)
 
-    BOTTOM_TEMP = cfg.scales.convert_from_dimensional_temperature(-1.8)
+    BOTTOM_TEMP = scales.convert_from_dimensional_temperature(-1.8)
     BOTTOM_SALT = 0
-    TEMP_IN_ICE = cfg.scales.convert_from_dimensional_temperature(-8.15)
+    TEMP_IN_ICE = scales.convert_from_dimensional_temperature(-8.15)
 
     chi = cfg.physical_params.expansion_coefficient
 
-    centers = Grids(cfg.numerical_params.I).centers
-    salt = _apply_value_in_ice_layer(
-        ICE_DEPTH, ice_value=SALT_IN_ICE, liquid_value=BOTTOM_SALT, grid=centers
-    )
-    gas = _apply_value_in_ice_layer(
+    centers = _get_centers(cfg.numerical_params.I)
+    enthalpy, salt, gas = _apply_value_in_ice_layer(
         ICE_DEPTH,
-        ice_value=cfg.initial_conditions_config.Barrow_initial_bulk_gas_in_ice * chi,
-        liquid_value=chi * far_gas_sat,
-        grid=centers,
-    )
-
-    temp = _apply_value_in_ice_layer(
-        ICE_DEPTH, ice_value=TEMP_IN_ICE, liquid_value=BOTTOM_TEMP, grid=centers
-    )
-    solid_fraction_in_mush = (salt + temp) / (
-        temp - cfg.physical_params.concentration_ratio
-    )
-    enthalpy = _apply_value_in_ice_layer(
-        ICE_DEPTH,
-        ice_value=temp - solid_fraction_in_mush * cfg.physical_params.stefan_number,
-        liquid_value=temp,
+        ice_value=(
+            _calculate_mushy_enthalpy(SALT_IN_ICE, TEMP_IN_ICE, cfg),
+            SALT_IN_ICE,
+            cfg.initial_conditions_config.Barrow_initial_bulk_gas_in_ice * chi,
+        ),
+        liquid_value=(BOTTOM_TEMP, BOTTOM_SALT, chi * far_gas_sat),
         grid=centers,
     )
 
@@ -168,52 +213,73 @@ def _get_oil_initial_conditions(cfg: Config):
     This is an idealised initial condition to investigate the impact of shortwave
     radiative forcing on melting bare ice
     """
-    ICE_DEPTH = cfg.initial_conditions_config.initial_ice_depth
+    initial_conditions_config = cfg.initial_conditions_config
+    ICE_DEPTH = initial_conditions_config.initial_ice_depth
 
     # Initialise with a constant bulk salinity in ice
-    SALT_IN_ICE = cfg.initial_conditions_config.initial_ice_bulk_salinity
+    SALT_IN_ICE = initial_conditions_config.initial_ice_bulk_salinity
 
-    BOTTOM_TEMP = cfg.initial_conditions_config.initial_ocean_temperature
+    BOTTOM_TEMP = initial_conditions_config.initial_ocean_temperature
     BOTTOM_SALT = 0
-    TEMP_IN_ICE = cfg.initial_conditions_config.initial_ice_temperature
+    TEMP_IN_ICE = initial_conditions_config.initial_ice_temperature
 
-    INITIAL_OIL_VOLUME_FRACTION = (
-        cfg.initial_conditions_config.initial_oil_volume_fraction
-    )
-
-    centers = Grids(cfg.numerical_params.I).centers
-    salt = _apply_value_in_ice_layer(
-        ICE_DEPTH, ice_value=SALT_IN_ICE, liquid_value=BOTTOM_SALT, grid=centers
-    )
-    gas = np.where(
-        centers < -cfg.initial_conditions_config.initial_oil_free_depth,
-        INITIAL_OIL_VOLUME_FRACTION,
-        0,
-    )
+    INITIAL_OIL_VOLUME_FRACTION = initial_conditions_config.initial_oil_volume_fraction
 
-    temp = _apply_value_in_ice_layer(
-        ICE_DEPTH, ice_value=TEMP_IN_ICE, liquid_value=BOTTOM_TEMP, grid=centers
-    )
-    solid_fraction_in_mush = (salt + temp) / (
-        temp - cfg.physical_params.concentration_ratio
-    )
-    enthalpy = _apply_value_in_ice_layer(
+    centers = _get_centers(cfg.numerical_params.I)
+    enthalpy, salt = _apply_value_in_ice_layer(
         ICE_DEPTH,
-        ice_value=temp - solid_fraction_in_mush * cfg.physical_params.stefan_number,
-        liquid_value=temp,
+        ice_value=(
+            _calculate_mushy_enthalpy(SALT_IN_ICE, TEMP_IN_ICE, cfg),
+            SALT_IN_ICE,
+        ),
+        liquid_value=(BOTTOM_TEMP, BOTTOM_SALT),
         grid=centers,
     )
+    # oil fills the contiguous part of the grid below the oil free layer
+    oil_free_boundary = np.searchsorted(
+        centers, -initial_conditions_config.initial_oil_free_depth, side="left"
+    )
+    gas = np.zeros_like(centers)
+    gas[:oil_free_boundary] = INITIAL_OIL_VOLUME_FRACTION
 
     return _pack_initial_state(cfg, enthalpy, salt, gas)
 
 
 def _pack_initial_state(cfg: Config, enthalpy, salt, gas) -> State:
-    match cfg.physical_params:
-        case EQMPhysicalParams():
-            return EQMState(0, enthalpy, salt, gas)
-        case DISEQPhysicalParams():
-            bulk_dissolved_gas = gas
-            gas_fraction = np.zeros_like(gas)
-            return DISEQState(0, enthalpy, salt, bulk_dissolved_gas, gas_fraction)
-        case _:
-            raise NotImplementedError
+    """Build the initial state for the model from the bulk enthalpy, salt and gas
+    shared by the initial condition builders"""
+    params_type = type(cfg.physical_params)
+    try:
+        pack_initial_state = _STATE_PACKERS[params_type]
+    except KeyError:
+        raise NotImplementedError(
+            f"No initial state implemented for {params_type.__name__}"
+        ) from None
+    return pack_initial_state(enthalpy, salt, gas)
+
+
+def _pack_EQM_initial_state(enthalpy, salt, gas) -> EQMState:
+    return EQMState(0, enthalpy, salt, gas)
+
+
+def _pack_DISEQ_initial_state(enthalpy, salt, gas) -> DISEQState:
+    bulk_dissolved_gas = gas
+    # No initial free phase gas. The initial state is only copied into the
+    # solution vector so a read only zero view avoids allocating the array.
+    gas_fraction = np.broadcast_to(0.0, gas.shape)
+    return DISEQState(0, enthalpy, salt, bulk_dissolved_gas, gas_fraction)
+
+
+# Dispatch tables built once on import, after the functions they refer to are
+# defined
+_INITIAL_CONDITIONS = {
+    UniformInitialConditions: _get_uniform_initial_conditions,
+    BRW09InitialConditions: _get_barrow_initial_conditions,
+    OilInitialConditions: _get_oil_initial_conditions,
+    PreviousSimulation: _get_previous_simulation_final_state,
+}
+
+_STATE_PACKERS = {
+    EQMPhysicalParams: _pack_EQM_initial_state,
+    DISEQPhysicalParams: _pack_DISEQ_initial_state,
+}
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import cached_property
 from pathlib import Path
 from typing import List
 import numpy as np
@@ -44,6 +45,8 @@ class _BaseResults:
     salt: NDArray
 
     def __post_init__(self):
+        # The enthalpy method is built once and shared by every saved state
+        self._enthalpy_method = get_enthalpy_method(self.cfg)
         self.states = list(map(self._get_state, self.times))
 
         boundary_conditions = get_boundary_conditions(self.cfg)
@@ -60,7 +63,7 @@ class _BaseResults:
     def _is_ice(self, time: float) -> NDArray:
         """Boolean mask True where ice is present on center grid cells at given
         non-dimensional time"""
-        return self.liquid_fraction[:, self._get_index(time)] < 1
+        return self.states[self._get_index(time)].liquid_fraction < 1
 
     def _top_cell_is_ice(self, time: float) -> bool:
         """Return True if top cell is ice or False if liquid"""
@@ -77,23 +80,25 @@ class _BaseResults:
         else:
             raise AttributeError("forcing has no start date")
 
-    @property
+    # The histories of the enthalpy method variables are stacked from the saved states
+    # on first access and reused by the diagnostics evaluated at each time
+    @cached_property
     def solid_fraction(self) -> NDArray:
         return _get_array_data("solid_fraction", self.states)
 
-    @property
+    @cached_property
     def liquid_fraction(self) -> NDArray:
         return _get_array_data("liquid_fraction", self.states)
 
-    @property
+    @cached_property
     def temperature(self) -> NDArray:
         return _get_array_data("temperature", self.states)
 
-    @property
+    @cached_property
     def liquid_salinity(self) -> NDArray:
         return _get_array_data("liquid_salinity", self.states)
 
-    @property
+    @cached_property
     def dissolved_gas(self) -> NDArray:
         return _get_array_data("dissolved_gas", self.states)
 
@@ -116,10 +121,7 @@ class _BaseResults:
     @property
     def bulk_argon(self) -> NDArray:
         """in mircomole Ar/L"""
-        scales = self.cfg.scales
-        return scales.convert_dimensional_bulk_air_to_argon_content(
-            scales.convert_to_dimensional_bulk_gas(self.bulk_gas)
-        )
+        return self.cfg.scales.convert_bulk_gas_to_argon_content(self.bulk_gas)
 
     def get_spectral_irradiance(self, time: float) -> oi.SixBandSpectralIrradiance:
         if not (
@@ -146,7 +148,7 @@ class _BaseResults:
 
     def ice_ocean_boundary(self, time: float) -> float:
         index = self._get_index(time)
-        liquid_fraction = self.liquid_fraction[:, index]
+        liquid_fraction = self.states[index].liquid_fraction
 
         # if no ice then no boundary
         if np.all(liquid_fraction == 1):
@@ -158,7 +160,7 @@ class _BaseResults:
 
     def ice_meltpond_boundary(self, time: float) -> float:
         index = self._get_index(time)
-        liquid_fraction = self.liquid_fraction[:, index]
+        liquid_fraction = self.states[index].liquid_fraction
 
         # if no ice then no meltpond
         if np.all(liquid_fraction == 1):
@@ -170,7 +172,7 @@ class _BaseResults:
 
     def ice_thickness(self, time: float) -> float:
         index = self._get_index(time)
-        liquid_fraction = self.liquid_fraction[:, index]
+        liquid_fraction = self.states[index].liquid_fraction
 
         # if no ice no thickness
         if np.all(liquid_fraction == 1):
@@ -213,24 +215,27 @@ class _BaseResults:
 
     @property
     def dimensional_salinity_dependent_liquid_density(self) -> NDArray:
-        reference_liquid_density = self.cfg.scales.liquid_density
-        return reference_liquid_density * (
-            1
-            + self.cfg.scales.haline_contraction_coefficient
-            * self.cfg.scales.salinity_difference
-            * self.liquid_salinity
+        # evaluated in place on the whole history so only one array is allocated
+        scales = self.cfg.scales
+        liquid_density = np.multiply(
+            scales.haline_contraction_coefficient * scales.salinity_difference,
+            self.liquid_salinity,
         )
+        liquid_density += 1
+        liquid_density *= scales.liquid_density
+        return liquid_density
 
     @property
     def dimensional_bulk_density(self) -> NDArray:
-        return (
-            (self.corrected_solid_fraction * self.cfg.scales.ice_density)
-            + (
-                self.corrected_liquid_fraction
-                * self.dimensional_salinity_dependent_liquid_density
-            )
-            + (self.gas_fraction * self.cfg.scales.gas_density)
+        # each phase contribution is accumulated in place into the solid part
+        scales = self.cfg.scales
+        bulk_density = self.corrected_solid_fraction * scales.ice_density
+        bulk_density += (
+            self.corrected_liquid_fraction
+            * self.dimensional_salinity_dependent_liquid_density
         )
+        bulk_density += self.gas_fraction * scales.gas_density
+        return bulk_density
 
     def dimensional_ice_average_bulk_density(self, time: float) -> float:
         index = self._get_index(time)
@@ -261,7 +266,7 @@ class _BaseResults:
         index = self._get_index(time)
         ghost_cell_temp = find_ghost_cell_temperature(self.states[index], self.cfg)
         return _convert_non_dim_temperature_to_kelvin(
-            self.cfg, 0.5 * (ghost_cell_temp + self.temperature[-1, index])
+            self.cfg, 0.5 * (ghost_cell_temp + self.states[index].temperature[-1])
         )
 
     def sensible_heat_flux(self, time: float) -> float:
@@ -313,10 +318,9 @@ class EQMResults(_BaseResults):
             self.salt[:, index],
             self.bulk_gas[:, index],
         )
-        enthalpy_method = get_enthalpy_method(self.cfg)
-        return enthalpy_method(state)
+        return self._enthalpy_method(state)
 
-    @property
+    @cached_property
     def gas_fraction(self) -> NDArray:
         return _get_array_data("gas_fraction", self.states)
 
@@ -336,8 +340,7 @@ class DISEQResults(_BaseResults):
             self.gas_fraction[:, index],
         )
 
-        enthalpy_method = get_enthalpy_method(self.cfg)
-        return enthalpy_method(state)
+        return self._enthalpy_method(state)
 
     @property
     def bulk_gas(self) -> NDArray:
@@ -391,4 +394,8 @@ def _get_array_data(attr: str, states: list[StateFull]) -> NDArray:
     for state in states:
         data_slices.append(getattr(state, attr))
 
-    return np.vstack(tuple(data_slices)).T
+    # the history is cached on the results and shared by every caller, so it is made
+    # read only rather than copied on each access
+    history = np.vstack(tuple(data_slices)).T
+    history.setflags(write=False)
+    return history
@@ -47,25 +47,26 @@ BubbleParams = MonoBubbleParams | PowerLawBubbleParams
 def get_dimensionless_bubble_params(
     dimensional_params: DimensionalParams,
 ) -> BubbleParams:
+    bubble_params = dimensional_params.bubble_params
     common_params = {
         "B": dimensional_params.B,
-        "pore_throat_scaling": dimensional_params.bubble_params.pore_throat_scaling,
-        "porosity_threshold": dimensional_params.bubble_params.porosity_threshold,
-        "porosity_threshold_value": dimensional_params.bubble_params.porosity_threshold_value,
-        "escape_ice_surface": dimensional_params.bubble_params.escape_ice_surface,
+        "pore_throat_scaling": bubble_params.pore_throat_scaling,
+        "porosity_threshold": bubble_params.porosity_threshold,
+        "porosity_threshold_value": bubble_params.porosity_threshold_value,
+        "escape_ice_surface": bubble_params.escape_ice_surface,
     }
-    match dimensional_params.bubble_params:
+    match bubble_params:
         case DimensionalMonoBubbleParams():
             return MonoBubbleParams(
                 **common_params,
-                bubble_radius_scaled=dimensional_params.bubble_params.bubble_radius_scaled,
+                bubble_radius_scaled=bubble_params.bubble_radius_scaled,
             )
         case DimensionalPowerLawBubbleParams():
             return PowerLawBubbleParams(
                 **common_params,
-                bubble_distribution_power=dimensional_params.bubble_params.bubble_distribution_power,
-                minimum_bubble_radius_scaled=dimensional_params.bubble_params.minimum_bubble_radius_scaled,
-                maximum_bubble_radius_scaled=dimensional_params.bubble_params.maximum_bubble_radius_scaled,
+                bubble_distribution_power=bubble_params.bubble_distribution_power,
+                minimum_bubble_radius_scaled=bubble_params.minimum_bubble_radius_scaled,
+                maximum_bubble_radius_scaled=bubble_params.maximum_bubble_radius_scaled,
             )
         case _:
             raise NotImplementedError
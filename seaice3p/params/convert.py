@@ -1,9 +1,52 @@
 from dataclasses import dataclass
+from functools import cached_property
+import numpy as np
 from serde import serde, coerce
 
 
 SECONDS_TO_DAYS = 1 / (60 * 60 * 24)
 
+# micromole of Argon per Liter of ice in one kg/m3 of air
+AIR_TO_ARGON_CONTENT = (
+    0.01288  # mass ratio of argon in air
+    * (1 / 3.9948e-8)  # micromoles of argon in a kilogram of argon
+    / 1e3  # liters in a meter cubed
+)
+
+
+def _shift_then_scale(value, shift, scale):
+    """Return (value - shift) / scale.
+
+    Arrays are shifted into a new output which is then scaled in place, so only one
+    temporary is allocated instead of two.
+    """
+    if isinstance(value, np.ndarray):
+        output = np.subtract(value, shift)
+        output /= scale
+        return output
+    return (value - shift) / scale
+
+
+def _scale_then_shift(value, scale, shift, out=None):
+    """Return scale * value + shift.
+
+    Arrays are scaled into a new output which is then shifted in place, so only one
+    temporary is allocated instead of two. If an out array is given the result is
+    written into it and nothing is allocated.
+    """
+    if out is not None or isinstance(value, np.ndarray):
+        output = np.multiply(scale, value, out=out)
+        output += shift
+        return output
+    return scale * value + shift
+
+
+def _scale(value, scale, out=None):
+    """Return scale * value, written into the out array if one is given"""
+    if out is None:
+        return scale * value
+    return np.multiply(scale, value, out=out)
+
 
 @serde(type_check=coerce)
 @dataclass(frozen=True)
@@ -22,103 +65,115 @@ class Scales:
     pore_radius: float  # m
     haline_contraction_coefficient: float  # 1/ppt
 
-    @property
+    @cached_property
     def time_scale(self):
         """in days"""
         return SECONDS_TO_DAYS * self.lengthscale**2 / self.thermal_diffusivity
 
-    @property
+    @cached_property
     def velocity_scale(self):
         """in m /day"""
         return self.lengthscale / self.time_scale
 
+    @cached_property
+    def heating_scale(self):
+        """heating rate in W/m3 of one dimensionless unit"""
+        return (
+            self.liquid_thermal_conductivity
+            * self.temperature_difference
+            / self.lengthscale**2
+        )
+
+    @cached_property
+    def heat_flux_scale(self):
+        """heat flux in W/m2 of one dimensionless unit"""
+        return (
+            self.liquid_thermal_conductivity
+            * self.temperature_difference
+            / self.lengthscale
+        )
+
     def convert_from_dimensional_temperature(self, dimensional_temperature):
         """Non dimensionalise temperature in deg C"""
-        return (
-            dimensional_temperature - self.ocean_freezing_temperature
-        ) / self.temperature_difference
+        return _shift_then_scale(
+            dimensional_temperature,
+            self.ocean_freezing_temperature,
+            self.temperature_difference,
+        )
 
-    def convert_to_dimensional_temperature(self, temperature):
+    def convert_to_dimensional_temperature(self, temperature, out=None):
         """get temperature in deg C from non dimensional temperature"""
-        return (
-            self.temperature_difference * temperature + self.ocean_freezing_temperature
+        return _scale_then_shift(
+            temperature,
+            self.temperature_difference,
+            self.ocean_freezing_temperature,
+            out=out,
         )
 
     def convert_from_dimensional_grid(self, dimensional_grid):
         """Non dimensionalise domain depths in meters"""
         return dimensional_grid / self.lengthscale
 
-    def convert_to_dimensional_grid(self, grid):
+    def convert_to_dimensional_grid(self, grid, out=None):
         """Get domain depths in meters from non dimensional values"""
-        return self.lengthscale * grid
+        return _scale(grid, self.lengthscale, out=out)
 
     def convert_from_dimensional_time(self, dimensional_time):
         """Non dimensionalise time in days"""
         return dimensional_time / self.time_scale
 
-    def convert_to_dimensional_time(self, time):
+    def convert_to_dimensional_time(self, time, out=None):
         """Convert non dimensional time into time in days since start of simulation"""
-        return self.time_scale * time
+        return _scale(time, self.time_scale, out=out)
 
     def convert_from_dimensional_bulk_salinity(self, dimensional_bulk_salinity):
         """Non dimensionalise bulk salinity in g/kg"""
-        return (
-            dimensional_bulk_salinity - self.ocean_salinity
-        ) / self.salinity_difference
+        return _shift_then_scale(
+            dimensional_bulk_salinity, self.ocean_salinity, self.salinity_difference
+        )
 
-    def convert_to_dimensional_bulk_salinity(self, bulk_salinity):
+    def convert_to_dimensional_bulk_salinity(self, bulk_salinity, out=None):
         """Convert non dimensional bulk salinity to g/kg"""
-        return self.salinity_difference * bulk_salinity + self.ocean_salinity
+        return _scale_then_shift(
+            bulk_salinity, self.salinity_difference, self.ocean_salinity, out=out
+        )
 
     def convert_from_dimensional_bulk_gas(self, dimensional_bulk_gas):
         """Non dimensionalise bulk gas content in kg/m3"""
         return dimensional_bulk_gas / self.gas_density
 
-    def convert_to_dimensional_bulk_gas(self, bulk_gas):
+    def convert_to_dimensional_bulk_gas(self, bulk_gas, out=None):
         """Convert dimensionless bulk gas content to kg/m3"""
-        return self.gas_density * bulk_gas
+        return _scale(bulk_gas, self.gas_density, out=out)
 
     def convert_dimensional_bulk_air_to_argon_content(self, dimensional_bulk_gas):
         """Convert kg/m3 of air to micromole of Argon per Liter of ice"""
-        mass_ratio_of_argon_in_air = 0.01288
-        micromoles_of_argon_in_a_kilogram_of_argon = 1 / (3.9948e-8)
-        liters_in_a_meter_cubed = 1e3
-        return (
-            dimensional_bulk_gas
-            * mass_ratio_of_argon_in_air
-            * micromoles_of_argon_in_a_kilogram_of_argon
-            / liters_in_a_meter_cubed
-        )
+        return dimensional_bulk_gas * AIR_TO_ARGON_CONTENT
+
+    def convert_bulk_gas_to_argon_content(self, bulk_gas):
+        """Convert dimensionless bulk gas content to micromole of Argon per Liter of ice
+
+        The two scale factors are combined first so an array is scaled in one pass.
+        """
+        return (self.gas_density * AIR_TO_ARGON_CONTENT) * bulk_gas
 
     def convert_from_dimensional_dissolved_gas(self, dimensional_dissolved_gas):
         """convert from dissolved gas in kg(gas)/kg(liquid) to dimensionless"""
         return dimensional_dissolved_gas / self.saturation_concentration
 
-    def convert_to_dimensional_dissolved_gas(self, dissolved_gas):
+    def convert_to_dimensional_dissolved_gas(self, dissolved_gas, out=None):
         """convert from non dimensional dissolved gas to dimensional dissolved gas in
         kg(gas)/kg(liquid)"""
-        return self.saturation_concentration * dissolved_gas
+        return _scale(dissolved_gas, self.saturation_concentration, out=out)
 
     def convert_from_dimensional_heating(self, dimensional_heating):
         """convert from heating rate in W/m3 to dimensionless units"""
-        return (
-            dimensional_heating
-            * self.lengthscale**2
-            / (self.liquid_thermal_conductivity * self.temperature_difference)
-        )
+        return dimensional_heating / self.heating_scale
 
     def convert_from_dimensional_heat_flux(self, dimensional_heat_flux):
         """convert from heat flux in W/m2 to dimensionless units"""
-        return (
-            dimensional_heat_flux
-            * self.lengthscale
-            / (self.liquid_thermal_conductivity * self.temperature_difference)
-        )
+        return dimensional_heat_flux / self.heat_flux_scale
 
-    def convert_to_dimensional_heat_flux(self, heat_flux):
+    def convert_to_dimensional_heat_flux(self, heat_flux, out=None):
         """convert from dimensionless heat flux to heat flux in W/m2"""
-        return (
-            heat_flux
-            * (self.liquid_thermal_conductivity * self.temperature_difference)
-            / self.lengthscale
-        )
+        return _scale(heat_flux, self.heat_flux_scale, out=out)
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import cached_property
 from serde import serde, coerce
 
 
@@ -17,7 +18,7 @@ class DimensionalBaseBubbleParams:
 class DimensionalMonoBubbleParams(DimensionalBaseBubbleParams):
     bubble_radius: float = 1e-3  # bubble radius in m
 
-    @property
+    @cached_property
     def bubble_radius_scaled(self):
         r"""calculate the bubble radius divided by the pore scale
 
@@ -34,7 +35,7 @@ class DimensionalPowerLawBubbleParams(DimensionalBaseBubbleParams):
     minimum_bubble_radius: float = 1e-6
     maximum_bubble_radius: float = 1e-3
 
-    @property
+    @cached_property
     def minimum_bubble_radius_scaled(self):
         r"""calculate the bubble radius divided by the pore scale
 
@@ -43,7 +44,7 @@ class DimensionalPowerLawBubbleParams(DimensionalBaseBubbleParams):
         """
         return self.minimum_bubble_radius / self.pore_radius
 
-    @property
+    @cached_property
     def maximum_bubble_radius_scaled(self):
         r"""calculate the bubble radius divided by the pore scale
 
@@ -9,14 +9,15 @@ output between physical and non-dimensional variables.
 """
 
 from pathlib import Path
-import numpy as np
+import math
 from serde import serde, coerce
-from serde.yaml import from_yaml, to_yaml
 from dataclasses import dataclass
+from functools import cached_property
 
 from ..convert import (
     Scales,
 )
+from ..yaml_io import dump_yaml, load_yaml
 from .water import DimensionalWaterParams
 from .gas import DimensionalDISEQGasParams, DimensionalEQMGasParams
 from .bubble import DimensionalMonoBubbleParams, DimensionalPowerLawBubbleParams
@@ -72,7 +73,7 @@ class DimensionalParams:
     frame_velocity_dimensional: float = 0  # velocity of frame in m/day
     gravity: float = 9.81  # m/s2
 
-    @property
+    @cached_property
     def damkohler_number(self):
         r"""Return damkohler number as ratio of thermal timescale to nucleation
         timescale
@@ -84,22 +85,22 @@ class DimensionalParams:
             (self.lengthscale**2) / self.water_params.thermal_diffusivity
         ) / self.gas_params.nucleation_timescale
 
-    @property
+    @cached_property
     def total_time(self):
         """calculate the total time in non dimensional units for the simulation"""
         return self.total_time_in_days / self.scales.time_scale
 
-    @property
+    @cached_property
     def savefreq(self):
         """calculate the save frequency in non dimensional time"""
         return self.savefreq_in_days / self.scales.time_scale
 
-    @property
+    @cached_property
     def frame_velocity(self):
         """calculate the frame velocity in non dimensional units"""
         return self.frame_velocity_dimensional / self.scales.velocity_scale
 
-    @property
+    @cached_property
     def B(self):
         r"""calculate the non dimensional scale for buoyant rise of gas bubbles as
 
@@ -117,7 +118,7 @@ class DimensionalParams:
         )
         return stokes_velocity / velocity_scale_in_m_per_second
 
-    @property
+    @cached_property
     def Rayleigh_salt(self):
         r"""Calculate the haline Rayleigh number as
 
@@ -141,7 +142,7 @@ class DimensionalParams:
             case NoBrineConvection():
                 return None
 
-    @property
+    @cached_property
     def expansion_coefficient(self):
         r"""calculate
 
@@ -154,23 +155,26 @@ class DimensionalParams:
             / self.gas_params.gas_density
         )
 
-    @property
+    @cached_property
     def lewis_gas(self):
-        r"""Calculate the lewis number for dissolved gas, return np.inf if there is no
+        r"""Calculate the lewis number for dissolved gas, return math.inf if there is no
         dissolved gas diffusion.
 
         .. math:: \text{Le}_\xi = \kappa / D_\xi
 
         """
         if self.gas_params.gas_diffusivity == 0:
-            return np.inf
+            return math.inf
 
         return self.water_params.thermal_diffusivity / self.gas_params.gas_diffusivity
 
-    @property
+    @cached_property
     def scales(self):
         """return a Scales object used for converting between dimensional and non
-        dimensional variables."""
+        dimensional variables.
+
+        The parameters are frozen so the object is built once and shared by all the
+        conversions made from these parameters."""
         return Scales(
             self.lengthscale,
             self.water_params.thermal_diffusivity,
@@ -193,11 +197,10 @@ class DimensionalParams:
         The name will be the name given with _dimensional appended to distinguish it
         from a saved non-dimensional configuration."""
         with open(directory / f"{self.name}_dimensional.yml", "w") as outfile:
-            outfile.write(to_yaml(self))
+            dump_yaml(self, outfile)
 
     @classmethod
     def load(cls, path):
         """load this object from a yaml configuration file."""
         with open(path, "r") as infile:
-            yaml = infile.read()
-        return from_yaml(cls, yaml)
+            return load_yaml(cls, infile)
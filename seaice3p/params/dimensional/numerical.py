@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import cached_property
 from serde import serde, coerce
 
 
@@ -11,6 +12,7 @@ class NumericalParams:
     regularisation: float = 1e-6
     solver_choice: str = "RK23"  # scipy.integrate.solve_IVP solver choice
 
-    @property
+    @cached_property
     def step(self):
+        """Grid cell width computed once from the number of cells"""
         return 1 / self.I
@@ -1,4 +1,6 @@
 from dataclasses import dataclass
+from functools import cached_property
+import math
 import numpy as np
 from serde import serde, coerce
 from scipy.optimize import fsolve
@@ -71,7 +73,7 @@ class DimensionalWaterParams:
     # dynamic liquid_viscosity = 2.7e-6 * liquid_density
     liquid_viscosity: float = 2.78e-3  # dynamic liquid viscosity in Pa.s
 
-    @property
+    @cached_property
     def eutectic_salinity(self):
         if isinstance(self.liquidus, LinearLiquidus):
             return self.liquidus.eutectic_salinity
@@ -82,7 +84,7 @@ class DimensionalWaterParams:
 
         raise NotImplementedError
 
-    @property
+    @cached_property
     def eutectic_temperature(self):
         if isinstance(self.liquidus, LinearLiquidus) or isinstance(
             self.liquidus, CubicLiquidus
@@ -91,7 +93,7 @@ class DimensionalWaterParams:
 
         raise NotImplementedError
 
-    @property
+    @cached_property
     def salinity_difference(self):
         r"""calculate difference between eutectic salinity and typical ocean salinity
 
@@ -100,7 +102,7 @@ class DimensionalWaterParams:
         """
         return self.eutectic_salinity - self.ocean_salinity
 
-    @property
+    @cached_property
     def ocean_freezing_temperature(self):
         """calculate salinity dependent freezing temperature using linear liquidus with
         ocean salinity
@@ -119,7 +121,7 @@ class DimensionalWaterParams:
 
         raise NotImplementedError
 
-    @property
+    @cached_property
     def temperature_difference(self):
         r"""calculate
 
@@ -128,7 +130,7 @@ class DimensionalWaterParams:
         """
         return self.ocean_freezing_temperature - self.eutectic_temperature
 
-    @property
+    @cached_property
     def concentration_ratio(self):
         r"""Calculate concentration ratio as
 
@@ -137,7 +139,7 @@ class DimensionalWaterParams:
         """
         return self.ocean_salinity / self.salinity_difference
 
-    @property
+    @cached_property
     def stefan_number(self):
         r"""calculate Stefan number
 
@@ -148,7 +150,7 @@ class DimensionalWaterParams:
             self.temperature_difference * self.liquid_specific_heat_capacity
         )
 
-    @property
+    @cached_property
     def thermal_diffusivity(self):
         r"""Return thermal diffusivity in m2/s
 
@@ -159,7 +161,7 @@ class DimensionalWaterParams:
             self.liquid_density * self.liquid_specific_heat_capacity
         )
 
-    @property
+    @cached_property
     def conductivity_ratio(self):
         r"""Calculate the ratio of solid to liquid thermal conductivity
 
@@ -168,7 +170,7 @@ class DimensionalWaterParams:
         """
         return self.solid_thermal_conductivity / self.liquid_thermal_conductivity
 
-    @property
+    @cached_property
     def specific_heat_ratio(self):
         r"""Calculate the ratio of solid to liquid specific heat capacities
 
@@ -177,7 +179,7 @@ class DimensionalWaterParams:
         """
         return self.solid_specific_heat_capacity / self.liquid_specific_heat_capacity
 
-    @property
+    @cached_property
     def eddy_diffusivity_ratio(self):
         r"""Calculate the ratio of eddy diffusivity to thermal diffusivity in
         the liquid phase
@@ -187,7 +189,7 @@ class DimensionalWaterParams:
         """
         return self.eddy_diffusivity / self.thermal_diffusivity
 
-    @property
+    @cached_property
     def snow_conductivity_ratio(self):
         r"""Calculate the ratio of snow to liquid thermal conductivity
 
@@ -196,15 +198,15 @@ class DimensionalWaterParams:
         """
         return self.snow_thermal_conductivity / self.liquid_thermal_conductivity
 
-    @property
+    @cached_property
     def lewis_salt(self):
-        r"""Calculate the lewis number for salt, return np.inf if there is no salt
+        r"""Calculate the lewis number for salt, return math.inf if there is no salt
         diffusion.
 
         .. math:: \text{Le}_S = \kappa / D_s
 
         """
         if self.salt_diffusivity == 0:
-            return np.inf
+            return math.inf
 
         return self.thermal_diffusivity / self.salt_diffusivity
@@ -1,4 +1,4 @@
-from functools import partial
+from functools import partial, cached_property, cache, lru_cache
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import Optional
@@ -23,15 +23,76 @@ from .dimensional import (
     DimensionalERA5Forcing,
     ERA5FileKeys,
 )
-import xarray as xr
-from metpy.calc import specific_humidity_from_dewpoint
-from metpy.units import units as metpyunits
+
+# Columns of the Barrow 2009 data file used by the forcings: time in days, air
+# temperature, temperature at the bottom of the snow, temperature at the top of the
+# ice and ocean temperature at 2.4m. See the metadata in seaice3p/forcing_data.
+_BARROW_DATA_COLUMNS = (0, 8, 18, 19, 43)
+
+
+@cache
+def _load_barrow_data() -> dict[int, NDArray]:
+    """Read the columns of the Barrow 2009 data file used by the forcings once per
+    process.
+
+    The file is purely numeric and tab delimited so it is parsed with np.loadtxt which
+    is much faster than np.genfromtxt, and only the columns needed are converted.
+    Returns a mapping from the column index in the file to the column. The same
+    arrays are shared by every forcing object so they are made read only.
+    """
+    data = np.loadtxt(
+        Path(__file__).parent.parent / "forcing_data/BRW09.txt",
+        delimiter="\t",
+        usecols=_BARROW_DATA_COLUMNS,
+    )
+    columns = {}
+    for position, column_index in enumerate(_BARROW_DATA_COLUMNS):
+        column = np.ascontiguousarray(data[:, position])
+        column.setflags(write=False)
+        columns[column_index] = column
+    return columns
 
 
 def _filter_missing_values(air_temp, days):
-    """Filter out missing values are recorded as 9999"""
-    is_missing = np.abs(air_temp) > 100
-    return air_temp[~is_missing], days[~is_missing]
+    """Filter out missing values are recorded as 9999
+
+    If no values are missing the inputs are returned without copying.
+    """
+    is_valid = np.abs(air_temp) <= 100
+    if is_valid.all():
+        return air_temp, days
+    return np.compress(is_valid, air_temp), np.compress(is_valid, days)
+
+
+class _MonotoneInterpolator:
+    """Linearly interpolate data in the same way as np.interp(x, xp, fp, right=np.nan)
+    for a sequence of scalar times which mostly increase between calls.
+
+    The index of the last interval used is kept so that successive calls during the
+    simulation only step to a neighbouring interval instead of bisecting the whole
+    record. Times outside of the record are passed to np.interp.
+    """
+
+    def __init__(self, xp: NDArray, fp: NDArray):
+        self._xp = xp.tolist()
+        self._fp = fp.tolist()
+        self._index = 0
+
+    def __call__(self, x: float) -> float:
+        xp, fp = self._xp, self._fp
+        if not (xp[0] <= x < xp[-1]):
+            return np.interp(x, xp, fp, right=np.nan)
+
+        # find interval with xp[index] <= x < xp[index + 1]
+        index = self._index
+        while x < xp[index]:
+            index -= 1
+        while x >= xp[index + 1]:
+            index += 1
+        self._index = index
+
+        slope = (fp[index + 1] - fp[index]) / (xp[index + 1] - xp[index])
+        return slope * (x - xp[index]) + fp[index]
 
 
 @serde(type_check=coerce)
@@ -51,6 +112,11 @@ class YearlyForcing:
     amplitude: float = 0.75
     period: float = 4.0
 
+    @cached_property
+    def angular_frequency(self) -> float:
+        """Angular frequency of the forcing computed once from the period"""
+        return 2 * np.pi / self.period
+
 
 @serde(type_check=coerce)
 class BRW09Forcing:
@@ -74,14 +140,12 @@ class BRW09Forcing:
             "bottom_snow": 18,
             "top_ice": 19,
         }
-        data = np.genfromtxt(
-            Path(__file__).parent.parent / "forcing_data/BRW09.txt", delimiter="\t"
-        )
+        data = _load_barrow_data()
         top_temp_index = DATA_INDICES[self.Barrow_top_temperature_data_choice]
         time_index = DATA_INDICES["time"]
 
-        barrow_top_temp = data[:, top_temp_index]
-        barrow_days = data[:, time_index] - data[0, time_index]
+        barrow_top_temp = data[top_temp_index]
+        barrow_days = data[time_index] - data[time_index][0]
         barrow_top_temp, barrow_days = _filter_missing_values(
             barrow_top_temp, barrow_days
         )
@@ -89,6 +153,10 @@ class BRW09Forcing:
         self.barrow_top_temp = barrow_top_temp
         self.barrow_days = barrow_days
 
+        # Provide function to interpolate temperature data at times in days during
+        # simulation
+        self.get_barrow_top_temp = _MonotoneInterpolator(barrow_days, barrow_top_temp)
+
 
 @serde(type_check=coerce)
 @dataclass(frozen=True)
@@ -125,46 +193,21 @@ class ERA5Forcing:
     oil_heating: DimensionalOilHeating = DimensionalBackgroundOilHeating()
 
     def __post_init__(self):
-        data = xr.open_dataset(self.data_path)
-        DATES = getattr(data, self.forcing_data_file_keys.time).to_numpy()
-        DIMLESS_TIMES = (1 / self.timescale_in_days) * np.array(
-            [
-                (date - np.datetime64(self.start_date)) / np.timedelta64(1, "D")
-                for date in DATES
-            ]
+        data = _load_ERA5_data(self.data_path, self.forcing_data_file_keys)
+        DIMLESS_TIMES = (1 / self.timescale_in_days) * (
+            (data["dates"] - np.datetime64(self.start_date)) / np.timedelta64(1, "D")
         )
 
-        # convert to deg C
-        T2M = (
-            getattr(data, self.forcing_data_file_keys.temperature_at_2m_in_K).to_numpy()
-            - 273.15
-        )
-        D2M = (
-            getattr(data, self.forcing_data_file_keys.dewpoint_at_2m_in_K).to_numpy()
-            - 273.15
-        )
-
-        LW = getattr(
-            data, self.forcing_data_file_keys.longwave_radiation_in_W_m2
-        ).to_numpy()
-        SW = getattr(
-            data, self.forcing_data_file_keys.shortwave_radiation_in_W_m2
-        ).to_numpy()
-
-        # convert to KPa
-        ATM = (
-            getattr(data, self.forcing_data_file_keys.surface_pressure_in_Pa).to_numpy()
-            / 1e3
-        )
+        T2M = data["temperature"]
+        LW = data["longwave"]
+        SW = data["shortwave"]
+        ATM = data["pressure"]
+        SPEC_HUM = data["specific_humidity"]
 
-        wind_key = self.forcing_data_file_keys.windspeed_at_2m_in_m_s
-        if wind_key is None:
+        if data["windspeed"] is None:
             WIND = np.full_like(DIMLESS_TIMES, self.turbulent_flux.windspeed)
         else:
-            WIND = getattr(data, wind_key).to_numpy()
-
-        # Calculate specific humidity in kg/kg from dewpoint temperature
-        SPEC_HUM = _calculate_specific_humidity(ATM, D2M)
+            WIND = data["windspeed"]
 
         snow_key = self.forcing_data_file_keys.snow_depth_in_m
         # if ERA5 standard short name for snow depth in m of water equivalent use snow
@@ -172,11 +215,11 @@ class ERA5Forcing:
         if snow_key == "sd":
             if self.snow_density is None:
                 raise ValueError("No snow density provided")
-            SNOW_DEPTH = getattr(data, "sd").to_numpy() * (1000 / self.snow_density)
+            SNOW_DEPTH = data["snow_depth"] * (1000 / self.snow_density)
 
         # If snow key is another name assume snow depth is just in m of snow
         elif snow_key is not None:
-            SNOW_DEPTH = getattr(data, snow_key).to_numpy()
+            SNOW_DEPTH = data["snow_depth"]
 
         # If snow key is None assume no snow
         else:
@@ -207,8 +250,71 @@ class ERA5Forcing:
         )
 
 
+def _load_ERA5_data(
+    data_path: Path, forcing_data_file_keys: ERA5FileKeys
+) -> dict[str, Optional[NDArray]]:
+    """Read the atmospheric variables from the reanalysis netCDF file.
+
+    Simulations in a parameter study usually share the same forcing file, so the
+    variables are read, converted and used to calculate the specific humidity once per
+    file rather than for every forcing object. The file is identified by its absolute
+    path and is assumed not to change for the life of the process. The same arrays
+    are shared by every forcing object so they are made read only. Windspeed and snow
+    depth are None when the file has no key for them.
+
+    Temperatures are returned in deg C, surface pressure in KPa and the snow depth
+    in the units of the file.
+    """
+    return _read_ERA5_file(Path(data_path).resolve(), forcing_data_file_keys)
+
+
+@lru_cache(maxsize=4)
+def _read_ERA5_file(
+    data_path: Path, forcing_data_file_keys: ERA5FileKeys
+) -> dict[str, Optional[NDArray]]:
+    # xarray is only needed to read the reanalysis data so it is imported here
+    # rather than slowing down every import of the parameters module
+    import xarray as xr
+
+    def read(key):
+        return getattr(data, key).to_numpy()
+
+    with xr.open_dataset(data_path) as data:
+        # convert to deg C
+        T2M = read(forcing_data_file_keys.temperature_at_2m_in_K) - 273.15
+        D2M = read(forcing_data_file_keys.dewpoint_at_2m_in_K) - 273.15
+        # convert to KPa
+        ATM = read(forcing_data_file_keys.surface_pressure_in_Pa) / 1e3
+        loaded = {
+            "dates": read(forcing_data_file_keys.time),
+            "temperature": T2M,
+            "longwave": read(forcing_data_file_keys.longwave_radiation_in_W_m2),
+            "shortwave": read(forcing_data_file_keys.shortwave_radiation_in_W_m2),
+            "pressure": ATM,
+            # Calculate specific humidity in kg/kg from dewpoint temperature
+            "specific_humidity": _calculate_specific_humidity(ATM, D2M),
+            "windspeed": None,
+            "snow_depth": None,
+        }
+        if forcing_data_file_keys.windspeed_at_2m_in_m_s is not None:
+            loaded["windspeed"] = read(forcing_data_file_keys.windspeed_at_2m_in_m_s)
+        if forcing_data_file_keys.snow_depth_in_m is not None:
+            loaded["snow_depth"] = read(forcing_data_file_keys.snow_depth_in_m)
+
+    for variable in loaded.values():
+        if variable is not None:
+            variable.setflags(write=False)
+    return loaded
+
+
 def _calculate_specific_humidity(pressure: NDArray, dewpoint: NDArray) -> NDArray:
-    """Take ERA5 data and return specific humidity at 2m in kg/kg"""
+    """Take ERA5 data and return specific humidity at 2m in kg/kg
+
+    metpy is slow to import and only needed here so it is imported on first use.
+    """
+    from metpy.calc import specific_humidity_from_dewpoint
+    from metpy.units import units as metpyunits
+
     return (
         specific_humidity_from_dewpoint(
             pressure * metpyunits.kPa, dewpoint * metpyunits.degC
@@ -240,56 +346,87 @@ ForcingConfig = (
 def get_dimensionless_forcing_config(
     dimensional_params: DimensionalParams,
 ) -> ForcingConfig:
+    config_type = type(dimensional_params.forcing_config)
+    try:
+        get_forcing_config = _FORCING_CONFIGS[config_type]
+    except KeyError:
+        raise NotImplementedError(
+            f"No forcing implemented for {config_type.__name__}"
+        ) from None
+    return get_forcing_config(dimensional_params)
+
+
+def _get_constant_forcing_config(
+    dimensional_params: DimensionalParams,
+) -> ConstantForcing:
+    top_temp = dimensional_params.scales.convert_from_dimensional_temperature(
+        dimensional_params.forcing_config.constant_top_temperature
+    )
+    return ConstantForcing(
+        constant_top_temperature=top_temp,
+    )
+
+
+def _get_yearly_forcing_config(dimensional_params: DimensionalParams) -> YearlyForcing:
+    return YearlyForcing(
+        offset=dimensional_params.forcing_config.offset,
+        amplitude=dimensional_params.forcing_config.amplitude,
+        period=dimensional_params.forcing_config.period,
+    )
+
+
+def _get_BRW09_forcing_config(dimensional_params: DimensionalParams) -> BRW09Forcing:
+    return BRW09Forcing(
+        Barrow_top_temperature_data_choice=dimensional_params.forcing_config.Barrow_top_temperature_data_choice,
+    )
+
+
+def _get_rad_forcing_config(dimensional_params: DimensionalParams) -> RadForcing:
+    return RadForcing(
+        SW_forcing=dimensional_params.forcing_config.SW_forcing,
+        LW_forcing=dimensional_params.forcing_config.LW_forcing,
+        turbulent_flux=dimensional_params.forcing_config.turbulent_flux,
+        oil_heating=dimensional_params.forcing_config.oil_heating,
+    )
+
+
+def _get_robin_forcing_config(dimensional_params: DimensionalParams) -> RobinForcing:
     scales = dimensional_params.scales
-    match dimensional_params.forcing_config:
-        case DimensionalConstantForcing():
-            top_temp = scales.convert_from_dimensional_temperature(
-                dimensional_params.forcing_config.constant_top_temperature
-            )
-            return ConstantForcing(
-                constant_top_temperature=top_temp,
-            )
-        case DimensionalYearlyForcing():
-            return YearlyForcing(
-                offset=dimensional_params.forcing_config.offset,
-                amplitude=dimensional_params.forcing_config.amplitude,
-                period=dimensional_params.forcing_config.period,
-            )
-        case DimensionalBRW09Forcing():
-            return BRW09Forcing(
-                Barrow_top_temperature_data_choice=dimensional_params.forcing_config.Barrow_top_temperature_data_choice,
-            )
-        case DimensionalRadForcing():
-            return RadForcing(
-                SW_forcing=dimensional_params.forcing_config.SW_forcing,
-                LW_forcing=dimensional_params.forcing_config.LW_forcing,
-                turbulent_flux=dimensional_params.forcing_config.turbulent_flux,
-                oil_heating=dimensional_params.forcing_config.oil_heating,
-            )
-        case DimensionalRobinForcing():
-            restoring_temperature = scales.convert_from_dimensional_temperature(
-                dimensional_params.forcing_config.restoring_temperature
-            )
-            biot = (
-                dimensional_params.lengthscale
-                * dimensional_params.forcing_config.heat_transfer_coefficient
-                / dimensional_params.water_params.liquid_thermal_conductivity
-            )
-            return RobinForcing(
-                biot=biot,
-                restoring_temperature=restoring_temperature,
-            )
-        case DimensionalERA5Forcing():
-            return ERA5Forcing(
-                data_path=dimensional_params.forcing_config.data_path,
-                start_date=dimensional_params.forcing_config.start_date,
-                timescale_in_days=dimensional_params.scales.time_scale,
-                forcing_data_file_keys=dimensional_params.forcing_config.forcing_data_file_keys,
-                snow_density=dimensional_params.water_params.snow_density,
-                SW_forcing=dimensional_params.forcing_config.SW_forcing,
-                LW_forcing=dimensional_params.forcing_config.LW_forcing,
-                turbulent_flux=dimensional_params.forcing_config.turbulent_flux,
-                oil_heating=dimensional_params.forcing_config.oil_heating,
-            )
-        case _:
-            raise NotImplementedError
+    restoring_temperature = scales.convert_from_dimensional_temperature(
+        dimensional_params.forcing_config.restoring_temperature
+    )
+    biot = (
+        dimensional_params.lengthscale
+        * dimensional_params.forcing_config.heat_transfer_coefficient
+        / dimensional_params.water_params.liquid_thermal_conductivity
+    )
+    return RobinForcing(
+        biot=biot,
+        restoring_temperature=restoring_temperature,
+    )
+
+
+def _get_ERA5_forcing_config(dimensional_params: DimensionalParams) -> ERA5Forcing:
+    return ERA5Forcing(
+        data_path=dimensional_params.forcing_config.data_path,
+        start_date=dimensional_params.forcing_config.start_date,
+        timescale_in_days=dimensional_params.scales.time_scale,
+        forcing_data_file_keys=dimensional_params.forcing_config.forcing_data_file_keys,
+        snow_density=dimensional_params.water_params.snow_density,
+        SW_forcing=dimensional_params.forcing_config.SW_forcing,
+        LW_forcing=dimensional_params.forcing_config.LW_forcing,
+        turbulent_flux=dimensional_params.forcing_config.turbulent_flux,
+        oil_heating=dimensional_params.forcing_config.oil_heating,
+    )
+
+
+# Dispatch table from the dimensional forcing configuration type to the function
+# building its non dimensional counterpart
+_FORCING_CONFIGS = {
+    DimensionalConstantForcing: _get_constant_forcing_config,
+    DimensionalYearlyForcing: _get_yearly_forcing_config,
+    DimensionalBRW09Forcing: _get_BRW09_forcing_config,
+    DimensionalRadForcing: _get_rad_forcing_config,
+    DimensionalRobinForcing: _get_robin_forcing_config,
+    DimensionalERA5Forcing: _get_ERA5_forcing_config,
+}
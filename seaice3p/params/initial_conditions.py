@@ -34,32 +34,63 @@ InitialConditionsConfig = (
 def get_dimensionless_initial_conditions_config(
     dimensional_params: DimensionalParams,
 ) -> InitialConditionsConfig:
+    config_type = type(dimensional_params.initial_conditions_config)
+    try:
+        get_initial_conditions_config = _INITIAL_CONDITIONS_CONFIGS[config_type]
+    except KeyError:
+        raise NotImplementedError(
+            f"No initial conditions implemented for {config_type.__name__}"
+        ) from None
+    return get_initial_conditions_config(dimensional_params)
+
+
+def _get_uniform_initial_conditions_config(
+    dimensional_params: DimensionalParams,
+) -> UniformInitialConditions:
+    return UniformInitialConditions()
+
+
+def _get_BRW09_initial_conditions_config(
+    dimensional_params: DimensionalParams,
+) -> BRW09InitialConditions:
+    return BRW09InitialConditions(
+        Barrow_initial_bulk_gas_in_ice=dimensional_params.initial_conditions_config.Barrow_initial_bulk_gas_in_ice
+    )
+
+
+def _get_oil_initial_conditions_config(
+    dimensional_params: DimensionalParams,
+) -> OilInitialConditions:
     scales = dimensional_params.scales
-    match dimensional_params.initial_conditions_config:
-        case UniformInitialConditions():
-            return UniformInitialConditions()
-        case BRW09InitialConditions():
-            return BRW09InitialConditions(
-                Barrow_initial_bulk_gas_in_ice=dimensional_params.initial_conditions_config.Barrow_initial_bulk_gas_in_ice
-            )
-        case DimensionalOilInitialConditions():
-            return OilInitialConditions(
-                initial_ice_depth=dimensional_params.initial_conditions_config.initial_ice_depth
-                / dimensional_params.lengthscale,
-                initial_ocean_temperature=scales.convert_from_dimensional_temperature(
-                    dimensional_params.initial_conditions_config.initial_ocean_temperature
-                ),
-                initial_ice_temperature=scales.convert_from_dimensional_temperature(
-                    dimensional_params.initial_conditions_config.initial_ice_temperature
-                ),
-                initial_oil_volume_fraction=dimensional_params.initial_conditions_config.initial_oil_volume_fraction,
-                initial_ice_bulk_salinity=scales.convert_from_dimensional_bulk_salinity(
-                    dimensional_params.initial_conditions_config.initial_ice_bulk_salinity
-                ),
-                initial_oil_free_depth=dimensional_params.initial_conditions_config.initial_oil_free_depth
-                / dimensional_params.lengthscale,
-            )
-        case PreviousSimulation():
-            return dimensional_params.initial_conditions_config
-        case _:
-            raise NotImplementedError
+    return OilInitialConditions(
+        initial_ice_depth=dimensional_params.initial_conditions_config.initial_ice_depth
+        / dimensional_params.lengthscale,
+        initial_ocean_temperature=scales.convert_from_dimensional_temperature(
+            dimensional_params.initial_conditions_config.initial_ocean_temperature
+        ),
+        initial_ice_temperature=scales.convert_from_dimensional_temperature(
+            dimensional_params.initial_conditions_config.initial_ice_temperature
+        ),
+        initial_oil_volume_fraction=dimensional_params.initial_conditions_config.initial_oil_volume_fraction,
+        initial_ice_bulk_salinity=scales.convert_from_dimensional_bulk_salinity(
+            dimensional_params.initial_conditions_config.initial_ice_bulk_salinity
+        ),
+        initial_oil_free_depth=dimensional_params.initial_conditions_config.initial_oil_free_depth
+        / dimensional_params.lengthscale,
+    )
+
+
+def _get_previous_simulation_config(
+    dimensional_params: DimensionalParams,
+) -> PreviousSimulation:
+    return dimensional_params.initial_conditions_config
+
+
+# Dispatch table from the dimensional initial conditions configuration type to the
+# function building its non dimensional counterpart
+_INITIAL_CONDITIONS_CONFIGS = {
+    UniformInitialConditions: _get_uniform_initial_conditions_config,
+    BRW09InitialConditions: _get_BRW09_initial_conditions_config,
+    DimensionalOilInitialConditions: _get_oil_initial_conditions_config,
+    PreviousSimulation: _get_previous_simulation_config,
+}
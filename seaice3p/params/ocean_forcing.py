@@ -2,10 +2,9 @@ from functools import partial
 from typing import Tuple
 from dataclasses import dataclass
 from serde import serde, coerce
-from pathlib import Path
 from datetime import datetime, timedelta
 import numpy as np
-from .forcing import _filter_missing_values
+from .forcing import _filter_missing_values, _MonotoneInterpolator, _load_barrow_data
 from .dimensional import (
     DimensionalParams,
     DimensionalFixedTempOceanForcing,
@@ -78,14 +77,15 @@ class MonthlyHeatFluxOceanForcing:
             period=365,
         )
 
+        # Parse the start date once rather than every time the heat flux is needed
+        self._start_datetime = datetime.strptime(self.start_date, "%Y-%m-%d")
+        self._start_of_year = datetime(self._start_datetime.year, 1, 1)
+
     def get_ocean_heat_flux(self, simulation_time: float) -> float:
-        start_datetime = datetime.strptime(self.start_date, "%Y-%m-%d")
-        current_datetime = start_datetime + timedelta(
+        current_datetime = self._start_datetime + timedelta(
             days=self.timescale_in_days * simulation_time
         )
-        current_day = (
-            current_datetime - datetime(start_datetime.year, 1, 1)
-        ).total_seconds() / 86400
+        current_day = (current_datetime - self._start_of_year).total_seconds() / 86400
         return self._interpolate_heat_flux(current_day)
 
 
@@ -103,14 +103,12 @@ class BRW09OceanForcing:
         Note the metadata explaining how to use the barrow temperature data is also
         in seaice3p/forcing_data.
         """
-        data = np.genfromtxt(
-            Path(__file__).parent.parent / "forcing_data/BRW09.txt", delimiter="\t"
-        )
+        data = _load_barrow_data()
         ocean_temp_index = 43
         time_index = 0
 
-        barrow_bottom_temp = data[:, ocean_temp_index]
-        barrow_ocean_days = data[:, time_index] - data[0, time_index]
+        barrow_bottom_temp = data[ocean_temp_index]
+        barrow_ocean_days = data[time_index] - data[time_index][0]
         barrow_bottom_temp, barrow_ocean_days = _filter_missing_values(
             barrow_bottom_temp, barrow_ocean_days
         )
@@ -118,6 +116,12 @@ class BRW09OceanForcing:
         self.barrow_bottom_temp = barrow_bottom_temp
         self.barrow_ocean_days = barrow_ocean_days
 
+        # Provide function to interpolate temperature data at times in days during
+        # simulation
+        self.get_barrow_bottom_temp = _MonotoneInterpolator(
+            barrow_ocean_days, barrow_bottom_temp
+        )
+
 
 OceanForcingConfig = (
     FixedTempOceanForcing
@@ -130,38 +134,71 @@ OceanForcingConfig = (
 def get_dimensionless_ocean_forcing_config(
     dimensional_params: DimensionalParams,
 ) -> OceanForcingConfig:
-    ocean_gas_sat = dimensional_params.gas_params.ocean_saturation_state
+    config_type = type(dimensional_params.ocean_forcing_config)
+    try:
+        get_ocean_forcing_config = _OCEAN_FORCING_CONFIGS[config_type]
+    except KeyError:
+        raise NotImplementedError(
+            f"No ocean forcing implemented for {config_type.__name__}"
+        ) from None
+    return get_ocean_forcing_config(dimensional_params)
+
+
+def _get_fixed_temp_ocean_forcing_config(
+    dimensional_params: DimensionalParams,
+) -> FixedTempOceanForcing:
+    ocean_temp = dimensional_params.scales.convert_from_dimensional_temperature(
+        dimensional_params.ocean_forcing_config.ocean_temp
+    )
+    return FixedTempOceanForcing(
+        ocean_temp=ocean_temp,
+        ocean_gas_sat=dimensional_params.gas_params.ocean_saturation_state,
+    )
+
+
+def _get_fixed_heat_flux_ocean_forcing_config(
+    dimensional_params: DimensionalParams,
+) -> FixedHeatFluxOceanForcing:
+    ocean_heat_flux = dimensional_params.scales.convert_from_dimensional_heat_flux(
+        dimensional_params.ocean_forcing_config.ocean_heat_flux
+    )
+    return FixedHeatFluxOceanForcing(
+        ocean_heat_flux=ocean_heat_flux,
+        ocean_gas_sat=dimensional_params.gas_params.ocean_saturation_state,
+    )
+
+
+def _get_monthly_heat_flux_ocean_forcing_config(
+    dimensional_params: DimensionalParams,
+) -> MonthlyHeatFluxOceanForcing:
     scales = dimensional_params.scales
-    match dimensional_params.ocean_forcing_config:
-        case DimensionalFixedTempOceanForcing():
-            ocean_temp = scales.convert_from_dimensional_temperature(
-                dimensional_params.ocean_forcing_config.ocean_temp
-            )
-            return FixedTempOceanForcing(
-                ocean_temp=ocean_temp, ocean_gas_sat=ocean_gas_sat
-            )
-        case DimensionalFixedHeatFluxOceanForcing():
-            ocean_heat_flux = scales.convert_from_dimensional_heat_flux(
-                dimensional_params.ocean_forcing_config.ocean_heat_flux
-            )
-            return FixedHeatFluxOceanForcing(
-                ocean_heat_flux=ocean_heat_flux, ocean_gas_sat=ocean_gas_sat
-            )
-        case DimensionalMonthlyHeatFluxOceanForcing():
-            monthly_ocean_heat_flux = tuple(
-                [
-                    scales.convert_from_dimensional_heat_flux(ocean_heat_flux)
-                    for ocean_heat_flux in dimensional_params.ocean_forcing_config.monthly_ocean_heat_flux
-                ]
-            )
-            return MonthlyHeatFluxOceanForcing(
-                start_date=dimensional_params.forcing_config.start_date,
-                timescale_in_days=dimensional_params.scales.time_scale,
-                monthly_ocean_heat_flux=monthly_ocean_heat_flux,
-                ocean_gas_sat=ocean_gas_sat,
-            )
-
-        case DimensionalBRW09OceanForcing():
-            return BRW09OceanForcing(ocean_gas_sat=ocean_gas_sat)
-        case _:
-            raise NotImplementedError
+    monthly_ocean_heat_flux = tuple(
+        [
+            scales.convert_from_dimensional_heat_flux(ocean_heat_flux)
+            for ocean_heat_flux in dimensional_params.ocean_forcing_config.monthly_ocean_heat_flux
+        ]
+    )
+    return MonthlyHeatFluxOceanForcing(
+        start_date=dimensional_params.forcing_config.start_date,
+        timescale_in_days=scales.time_scale,
+        monthly_ocean_heat_flux=monthly_ocean_heat_flux,
+        ocean_gas_sat=dimensional_params.gas_params.ocean_saturation_state,
+    )
+
+
+def _get_BRW09_ocean_forcing_config(
+    dimensional_params: DimensionalParams,
+) -> BRW09OceanForcing:
+    return BRW09OceanForcing(
+        ocean_gas_sat=dimensional_params.gas_params.ocean_saturation_state
+    )
+
+
+# Dispatch table from the dimensional ocean forcing configuration type to the
+# function building its non dimensional counterpart
+_OCEAN_FORCING_CONFIGS = {
+    DimensionalFixedTempOceanForcing: _get_fixed_temp_ocean_forcing_config,
+    DimensionalFixedHeatFluxOceanForcing: _get_fixed_heat_flux_ocean_forcing_config,
+    DimensionalMonthlyHeatFluxOceanForcing: _get_monthly_heat_flux_ocean_forcing_config,
+    DimensionalBRW09OceanForcing: _get_BRW09_ocean_forcing_config,
+}
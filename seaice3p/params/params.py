@@ -6,7 +6,6 @@ as methods to save and load this configuration to a yaml file."""
 from pathlib import Path
 from dataclasses import dataclass
 from serde import serde, coerce
-from serde.yaml import from_yaml, to_yaml
 
 from .ocean_forcing import OceanForcingConfig, get_dimensionless_ocean_forcing_config
 from .forcing import ForcingConfig, get_dimensionless_forcing_config
@@ -25,6 +24,7 @@ from .convection import (
 )
 from .convert import Scales
 from .dimensional import DimensionalParams, NumericalParams
+from .yaml_io import dump_yaml, load_yaml
 
 
 @serde(type_check=coerce)
@@ -44,18 +44,19 @@ class Config:
     forcing_config: ForcingConfig
     ocean_forcing_config: OceanForcingConfig
     initial_conditions_config: InitialConditionsConfig
+    # NumericalParams is frozen so a single default instance is safely shared by all
+    # configurations, and dataclasses.replace gives modified copies for sweeps
     numerical_params: NumericalParams = NumericalParams()
     scales: Scales | None = None
 
     def save(self, directory: Path):
         with open(directory / f"{self.name}.yml", "w") as outfile:
-            outfile.write(to_yaml(self))
+            dump_yaml(self, outfile)
 
     @classmethod
     def load(cls, path):
         with open(path, "r") as infile:
-            yaml = infile.read()
-        return from_yaml(cls, yaml)
+            return load_yaml(cls, infile)
 
 
 def get_config(dimensional_params: DimensionalParams) -> Config:
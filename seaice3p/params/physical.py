@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import partial
 from typing import Callable, Optional
 import numpy as np
 from serde import serde, coerce
@@ -59,72 +60,75 @@ class DISEQPhysicalParams(BasePhysicalParams):
 PhysicalParams = EQMPhysicalParams | DISEQPhysicalParams
 
 
+def _get_liquidus_salinity(temperature, scales, liquidus: CubicLiquidus):
+    """Non dimensional liquidus salinity at the given non dimensional temperature"""
+    return scales.convert_from_dimensional_bulk_salinity(
+        liquidus.get_liquidus_salinity(
+            scales.convert_to_dimensional_temperature(temperature)
+        )
+    )
+
+
+def _get_liquidus_temperature(salinity, scales, liquidus: CubicLiquidus):
+    """Non dimensional liquidus temperature at the given non dimensional salinity"""
+    return scales.convert_from_dimensional_temperature(
+        liquidus.get_liquidus_temperature(
+            scales.convert_to_dimensional_bulk_salinity(salinity)
+        )
+    )
+
+
 def get_dimensionless_physical_params(
     dimensional_params: DimensionalParams,
 ) -> PhysicalParams:
-
+    """return a PhysicalParams object"""
     if isinstance(dimensional_params.water_params.liquidus, LinearLiquidus):
         get_liquidus_salinity = None
         get_liquidus_temperature = None
     elif isinstance(dimensional_params.water_params.liquidus, CubicLiquidus):
-        get_liquidus_salinity = (
-            lambda T: dimensional_params.scales.convert_from_dimensional_bulk_salinity(
-                dimensional_params.water_params.liquidus.get_liquidus_salinity(
-                    dimensional_params.scales.convert_to_dimensional_temperature(T)
-                )
-            )
+        # These are evaluated by the enthalpy method on every right hand side
+        # evaluation, so bind the scales and liquidus once here rather than looking
+        # them up through the dimensional parameters on each call. Partials of module
+        # level functions keep the configuration picklable for batch runs.
+        scales = dimensional_params.scales
+        liquidus = dimensional_params.water_params.liquidus
+        get_liquidus_salinity = partial(
+            _get_liquidus_salinity, scales=scales, liquidus=liquidus
         )
-        get_liquidus_temperature = (
-            lambda S: dimensional_params.scales.convert_from_dimensional_temperature(
-                dimensional_params.water_params.liquidus.get_liquidus_temperature(
-                    dimensional_params.scales.convert_to_dimensional_bulk_salinity(S)
-                )
-            )
+        get_liquidus_temperature = partial(
+            _get_liquidus_temperature, scales=scales, liquidus=liquidus
         )
 
     else:
         raise NotImplementedError
 
-    """return a PhysicalParams object"""
-    match dimensional_params.gas_params:
+    # Parameters shared by both gas models, looked up once for whichever is built
+    water_params = dimensional_params.water_params
+    gas_params = dimensional_params.gas_params
+    common_params = dict(
+        expansion_coefficient=dimensional_params.expansion_coefficient,
+        concentration_ratio=water_params.concentration_ratio,
+        stefan_number=water_params.stefan_number,
+        lewis_salt=water_params.lewis_salt,
+        lewis_gas=dimensional_params.lewis_gas,
+        frame_velocity=dimensional_params.frame_velocity,
+        specific_heat_ratio=water_params.specific_heat_ratio,
+        conductivity_ratio=water_params.conductivity_ratio,
+        eddy_diffusivity_ratio=water_params.eddy_diffusivity_ratio,
+        snow_conductivity_ratio=water_params.snow_conductivity_ratio,
+        tolerable_super_saturation_fraction=gas_params.tolerable_super_saturation_fraction,
+        gas_viscosity_ratio=gas_params.gas_viscosity / water_params.liquid_viscosity,
+        gas_bubble_eddy_diffusion=gas_params.gas_bubble_eddy_diffusion,
+        get_liquidus_salinity=get_liquidus_salinity,
+        get_liquidus_temperature=get_liquidus_temperature,
+    )
+
+    match gas_params:
         case DimensionalEQMGasParams():
-            return EQMPhysicalParams(
-                expansion_coefficient=dimensional_params.expansion_coefficient,
-                concentration_ratio=dimensional_params.water_params.concentration_ratio,
-                stefan_number=dimensional_params.water_params.stefan_number,
-                lewis_salt=dimensional_params.water_params.lewis_salt,
-                lewis_gas=dimensional_params.lewis_gas,
-                frame_velocity=dimensional_params.frame_velocity,
-                specific_heat_ratio=dimensional_params.water_params.specific_heat_ratio,
-                conductivity_ratio=dimensional_params.water_params.conductivity_ratio,
-                eddy_diffusivity_ratio=dimensional_params.water_params.eddy_diffusivity_ratio,
-                snow_conductivity_ratio=dimensional_params.water_params.snow_conductivity_ratio,
-                tolerable_super_saturation_fraction=dimensional_params.gas_params.tolerable_super_saturation_fraction,
-                gas_viscosity_ratio=dimensional_params.gas_params.gas_viscosity
-                / dimensional_params.water_params.liquid_viscosity,
-                gas_bubble_eddy_diffusion=dimensional_params.gas_params.gas_bubble_eddy_diffusion,
-                get_liquidus_salinity=get_liquidus_salinity,
-                get_liquidus_temperature=get_liquidus_temperature,
-            )
+            return EQMPhysicalParams(**common_params)
         case DimensionalDISEQGasParams():
             return DISEQPhysicalParams(
-                expansion_coefficient=dimensional_params.expansion_coefficient,
-                concentration_ratio=dimensional_params.water_params.concentration_ratio,
-                stefan_number=dimensional_params.water_params.stefan_number,
-                lewis_salt=dimensional_params.water_params.lewis_salt,
-                lewis_gas=dimensional_params.lewis_gas,
-                frame_velocity=dimensional_params.frame_velocity,
-                specific_heat_ratio=dimensional_params.water_params.specific_heat_ratio,
-                conductivity_ratio=dimensional_params.water_params.conductivity_ratio,
-                eddy_diffusivity_ratio=dimensional_params.water_params.eddy_diffusivity_ratio,
-                snow_conductivity_ratio=dimensional_params.water_params.snow_conductivity_ratio,
-                tolerable_super_saturation_fraction=dimensional_params.gas_params.tolerable_super_saturation_fraction,
-                gas_viscosity_ratio=dimensional_params.gas_params.gas_viscosity
-                / dimensional_params.water_params.liquid_viscosity,
-                gas_bubble_eddy_diffusion=dimensional_params.gas_params.gas_bubble_eddy_diffusion,
-                get_liquidus_salinity=get_liquidus_salinity,
-                get_liquidus_temperature=get_liquidus_temperature,
-                damkohler_number=dimensional_params.damkohler_number,
+                **common_params, damkohler_number=dimensional_params.damkohler_number
             )
         case _:
             raise NotImplementedError
@@ -0,0 +1,28 @@
+"""YAML parser and emitter shared by the configuration classes when loading from and
+saving to file.
+
+Use the libyaml parser and emitter when PyYAML has been built with them as they are
+much faster than the pure Python implementations and give the same results.
+"""
+
+import yaml
+from serde import from_dict, to_dict
+
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
+
+
+def load_yaml(cls, stream):
+    """deserialise an object of the serde class from the stream as
+    serde.yaml.from_yaml does but through the faster parser"""
+    data = yaml.load(stream, Loader=YamlLoader)
+    return from_dict(cls, data, reuse_instances=False)
+
+
+def dump_yaml(obj, stream) -> None:
+    """serialise the serde object to the stream as serde.yaml.to_yaml does but
+    through the faster emitter"""
+    data = to_dict(obj, reuse_instances=False, convert_sets=True)
+    yaml.dump(data, stream, Dumper=YamlDumper)
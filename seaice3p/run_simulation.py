@@ -9,6 +9,7 @@ This solver uses adaptive timestepping which makes it a good choice for running
 simulations with large buoyancy driven gas bubble velocities and we save the output
 at intervals given by the savefreq parameter in configuration.
 """
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Literal, Callable, List
 import numpy as np
@@ -26,24 +27,56 @@ from .grids import Grids
 from .initial_conditions import get_initial_conditions
 
 
-def run_batch(list_of_cfg: List[Config], directory: Path, verbosity_level=0) -> None:
+def run_batch(
+    list_of_cfg: List[Config],
+    directory: Path,
+    verbosity_level=0,
+    number_of_processes: int = 1,
+) -> None:
     """Run a batch of simulations from a list of configurations.
 
     Each simulation name is logged, as well as if it successfully runs or crashes.
     Output from each simulation is saved in a .npz file.
 
+    The simulations are independent so if more than one process is requested they
+    are distributed over a pool of worker processes.
+
     :param list_of_cfg: list of configurations
     :type list_of_cfg: List[seaice3p.params.Config]
+    :param number_of_processes: number of simulations to run concurrently
+    :type number_of_processes: int
 
     """
+    if number_of_processes <= 1:
+        for cfg in list_of_cfg:
+            _solve_in_batch(cfg, directory, verbosity_level)
+        return
+
+    with ProcessPoolExecutor(max_workers=number_of_processes) as executor:
+        futures = [
+            executor.submit(_solve_in_batch, cfg, directory, verbosity_level)
+            for cfg in list_of_cfg
+        ]
+        # errors in a simulation are logged by the worker, so any error here comes
+        # from sending the simulation to the pool and is logged in the same way
+        optprint = get_printer(verbosity_level, verbosity_threshold=1)
+        for cfg, future in zip(list_of_cfg, futures):
+            try:
+                future.result()
+            except Exception as e:
+                optprint(f"{cfg.name} crashed")
+                optprint(f"{e}")
+
+
+def _solve_in_batch(cfg: Config, directory: Path, verbosity_level: int) -> None:
+    """Solve a single simulation in a batch logging if it crashes"""
     optprint = get_printer(verbosity_level, verbosity_threshold=1)
-    for cfg in list_of_cfg:
-        optprint(f"seaice3pv{__version__}: {cfg.name}")
-        try:
-            solve(cfg, directory, verbosity_level=verbosity_level)
-        except Exception as e:
-            optprint(f"{cfg.name} crashed")
-            optprint(f"{e}")
+    optprint(f"seaice3pv{__version__}: {cfg.name}")
+    try:
+        solve(cfg, directory, verbosity_level=verbosity_level)
+    except Exception as e:
+        optprint(f"{cfg.name} crashed")
+        optprint(f"{e}")
 
 
 def solve(cfg: Config, directory: Path, verbosity_level=0) -> Literal[0]:
@@ -100,14 +133,7 @@ def _get_ode_fun(cfg: Config, verbosity_level=0) -> Callable[[float, NDArray], N
     unpack = get_unpacker(cfg)
     equations = get_equations(cfg, grids)
 
-    optprint = get_printer(verbosity_level, verbosity_threshold=2)
-
     def ode_fun(time, solution_vector):
-        optprint(
-            f"{cfg.name}: time={time:.3f}/{cfg.total_time}\r",
-            end="",
-        )
-
         # Let state module handle providing the correct State class based on
         # simulation configuration
         state = unpack(time, solution_vector)
@@ -116,4 +142,21 @@ def _get_ode_fun(cfg: Config, verbosity_level=0) -> Callable[[float, NDArray], N
 
         return equations(state_BCs)
 
-    return ode_fun
+    # Only wrap the right hand side with progress printing when it will be shown so
+    # that the message is not formatted on every evaluation of a silent run
+    PROGRESS_VERBOSITY_THRESHOLD = 2
+    if verbosity_level < PROGRESS_VERBOSITY_THRESHOLD:
+        return ode_fun
+
+    optprint = get_printer(
+        verbosity_level, verbosity_threshold=PROGRESS_VERBOSITY_THRESHOLD
+    )
+
+    def verbose_ode_fun(time, solution_vector):
+        optprint(
+            f"{cfg.name}: time={time:.3f}/{cfg.total_time}\r",
+            end="",
+        )
+        return ode_fun(time, solution_vector)
+
+    return verbose_ode_fun
@@ -17,8 +17,10 @@ def get_unpacker(cfg: Config) -> Callable[[float, NDArray], State]:
         DISEQPhysicalParams: _unpack_DISEQ,
     }
 
+    unpack_solution_vector = fun_map[type(cfg.physical_params)]
+
     def unpack(time, solution_vector) -> State:
-        return fun_map[type(cfg.physical_params)](time, solution_vector)
+        return unpack_solution_vector(time, solution_vector)
 
     return unpack
 
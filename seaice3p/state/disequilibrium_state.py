@@ -93,13 +93,16 @@ class DISEQStateFull:
         return self.bulk_dissolved_gas + self.gas_fraction
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DISEQStateBCs:
     """Stores information needed for solution at one timestep with BCs on ghost
     cells as well
 
     Initialiase the prime variables for the solver:
     enthalpy, bulk salinity and bulk air
+
+    The arrays are views onto the rows of a single contiguous block, in the order of
+    the fields below, allocated when the boundary conditions are added.
     """
 
     time: float
@@ -1,9 +1,8 @@
 from dataclasses import dataclass
-import numpy as np
 from numpy.typing import NDArray
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EQMState:
     """Contains the principal variables for solution with equilibrium gas phase:
 
@@ -20,7 +19,7 @@ class EQMState:
     gas: NDArray
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EQMStateFull:
     """Contains all variables variables for solution with equilibrium gas phase
     after running the enthalpy method on EQMSate.
@@ -54,13 +53,16 @@ class EQMStateFull:
     gas_fraction: NDArray
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EQMStateBCs:
     """Stores information needed for solution at one timestep with BCs on ghost
     cells as well
 
     Initialiase the prime variables for the solver:
     enthalpy, bulk salinity and bulk air
+
+    The arrays are views onto the rows of a single contiguous block, in the order of
+    the fields below, allocated when the boundary conditions are added.
     """
 
     time: float
@@ -0,0 +1,21 @@
+from pathlib import Path
+from seaice3p import DimensionalParams, get_config
+
+
+def test_loading_same_file_gives_independent_objects():
+    path = Path("tests/test_configurations/best_barrow/best_barrow_dimensional.yml")
+    first = DimensionalParams.load(path)
+    second = DimensionalParams.load(path)
+
+    assert first == second
+    assert first is not second
+    assert first.forcing_config is not second.forcing_config
+
+    first_cfg = get_config(first)
+    second_cfg = get_config(second)
+    assert first_cfg == second_cfg
+    assert first_cfg is not second_cfg
+    assert (
+        first_cfg.forcing_config.get_barrow_top_temp
+        is not second_cfg.forcing_config.get_barrow_top_temp
+    )
@@ -0,0 +1,200 @@
+"""Regression test for the enthalpy method against the masked assignment formulas it
+was originally written with.
+
+States are taken on a grid of bulk enthalpy and bulk salinity refined onto every
+phase boundary and just inside the liquidus where the mushy layer solid fraction is
+small.
+"""
+
+import numpy as np
+import pytest
+from scipy.optimize import fsolve
+from seaice3p import (
+    DimensionalParams,
+    get_config,
+    DimensionalWaterParams,
+    CubicLiquidus,
+    LinearLiquidus,
+    DimensionalConstantForcing,
+    DimensionalFixedTempOceanForcing,
+    UniformInitialConditions,
+    DimensionalEQMGasParams,
+    NoBrineConvection,
+    DimensionalMonoBubbleParams,
+    NumericalParams,
+)
+from seaice3p.enthalpy_method import get_enthalpy_method
+from seaice3p.enthalpy_method.common import _calculate_quadratic_root
+from seaice3p.enthalpy_method.phase_boundaries import (
+    get_phase_masks,
+    _calculate_liquidus,
+    _calculate_eutectic,
+    _calculate_solidus,
+)
+from seaice3p.state import EQMState
+
+
+def _reference_solid_fraction(enthalpy, salt, physical_params, phase_masks):
+    conc = physical_params.concentration_ratio
+    salt = np.where(salt + conc < 1e-6, -conc + 1e-6, salt)
+
+    solid_fraction = np.full_like(enthalpy, np.nan)
+    L, M, E, S = phase_masks
+    St = physical_params.stefan_number
+    ratio = physical_params.specific_heat_ratio
+
+    solid_fraction[L] = 0
+    solid_fraction[E] = -(1 + enthalpy[E]) / (St + ratio - 1)
+    solid_fraction[S] = 1
+
+    if np.all(M == False):
+        return solid_fraction
+
+    if physical_params.get_liquidus_salinity is None:
+        A = St + conc * (1 - ratio)
+        B = enthalpy[M] - St - conc + salt[M] * (1 - ratio)
+        C = -(enthalpy[M] + salt[M])
+        solid_fraction[M] = (1 / (2 * A)) * (-B - np.sqrt(B**2 - 4 * A * C))
+        return solid_fraction
+
+    def residual(solid_fraction):
+        temperature = (enthalpy[M] + solid_fraction * St) / (
+            1 + (ratio - 1) * solid_fraction
+        )
+        return (
+            salt[M]
+            + (conc + physical_params.get_liquidus_salinity(temperature))
+            * solid_fraction
+            - physical_params.get_liquidus_salinity(temperature)
+        )
+
+    solid_fraction[M] = fsolve(residual, np.full_like(enthalpy[M], 0.5))
+    return solid_fraction
+
+
+def _reference_temperature(enthalpy, solid_fraction, physical_params, phase_masks):
+    L, M, E, S = phase_masks
+    St = physical_params.stefan_number
+    ratio = physical_params.specific_heat_ratio
+
+    temperature = np.full_like(enthalpy, np.nan)
+    temperature[L] = enthalpy[L]
+    temperature[M] = (enthalpy[M] + solid_fraction[M] * St) / (
+        1 + (ratio - 1) * solid_fraction[M]
+    )
+    temperature[E] = -1
+    temperature[S] = (enthalpy[S] + St) / ratio
+    return temperature
+
+
+def _reference_liquid_salinity(salt, temperature, physical_params, phase_masks):
+    conc = physical_params.concentration_ratio
+    salt = np.where(salt + conc < 1e-6, -conc + 1e-6, salt)
+
+    liquid_salinity = np.full_like(salt, np.nan)
+    L, M, E, S = phase_masks
+    liquid_salinity[L] = salt[L]
+    liquid_salinity[M] = -temperature[M]
+    liquid_salinity[E] = 1
+    liquid_salinity[S] = 1
+    return liquid_salinity
+
+
+def _get_state_grid(physical_params, number_of_salts, number_of_enthalpies):
+    """Bulk enthalpy and salinity on a regular grid, on each phase boundary and
+    approaching the liquidus from inside the mushy layer"""
+    conc = physical_params.concentration_ratio
+    St = physical_params.stefan_number
+    ratio = physical_params.specific_heat_ratio
+
+    salt = np.linspace(-conc + 1e-3, 1 - 1e-3, number_of_salts)
+    enthalpy = np.linspace(-St - ratio - 1, 1, number_of_enthalpies)
+
+    boundaries = [
+        _calculate_liquidus(salt, physical_params),
+        _calculate_eutectic(salt, physical_params),
+        _calculate_solidus(salt, physical_params),
+    ]
+    offsets = np.concatenate([[0, 1e-9], -np.logspace(-12, -2, 11)])
+
+    enthalpies = [np.broadcast_to(enthalpy[:, np.newaxis], (enthalpy.size, salt.size))]
+    enthalpies += [boundary + offset for boundary in boundaries for offset in offsets]
+    enthalpy_grid = np.vstack(enthalpies)
+    salt_grid = np.broadcast_to(salt, enthalpy_grid.shape)
+    return enthalpy_grid.ravel(), salt_grid.ravel().copy()
+
+
+@pytest.mark.parametrize(
+    "liquidus, number_of_salts, number_of_enthalpies",
+    [(LinearLiquidus(), 41, 61), (CubicLiquidus(), 6, 8)],
+    ids=["linear", "cubic"],
+)
+def test_enthalpy_method_matches_reference(
+    liquidus, number_of_salts, number_of_enthalpies
+):
+    cfg = get_config(
+        DimensionalParams(
+            name="enthalpy_method",
+            total_time_in_days=1,
+            savefreq_in_days=1,
+            lengthscale=1,
+            water_params=DimensionalWaterParams(liquidus=liquidus),
+            gas_params=DimensionalEQMGasParams(),
+            bubble_params=DimensionalMonoBubbleParams(),
+            brine_convection_params=NoBrineConvection(),
+            forcing_config=DimensionalConstantForcing(),
+            ocean_forcing_config=DimensionalFixedTempOceanForcing(),
+            initial_conditions_config=UniformInitialConditions(),
+            numerical_params=NumericalParams(I=24),
+        )
+    )
+    physical_params = cfg.physical_params
+    enthalpy, salt = _get_state_grid(
+        physical_params, number_of_salts, number_of_enthalpies
+    )
+    state = EQMState(0.0, enthalpy, salt, np.full_like(enthalpy, 1e-3))
+
+    # every phase is present and the phases do not overlap
+    phase_masks = get_phase_masks(state, physical_params)
+    assert all(np.any(mask) for mask in phase_masks)
+    assert np.all(np.sum(phase_masks, axis=0) == 1)
+
+    solid_fraction = _reference_solid_fraction(
+        enthalpy, salt, physical_params, phase_masks
+    )
+    temperature = _reference_temperature(
+        enthalpy, solid_fraction, physical_params, phase_masks
+    )
+    liquid_salinity = _reference_liquid_salinity(
+        salt, temperature, physical_params, phase_masks
+    )
+
+    state_full = get_enthalpy_method(cfg)(state)
+    tolerances = {"rtol": 1e-10, "atol": 1e-12}
+    np.testing.assert_allclose(state_full.solid_fraction, solid_fraction, **tolerances)
+    np.testing.assert_allclose(
+        state_full.liquid_fraction, 1 - solid_fraction, **tolerances
+    )
+    np.testing.assert_allclose(state_full.temperature, temperature, **tolerances)
+    np.testing.assert_allclose(
+        state_full.liquid_salinity, liquid_salinity, **tolerances
+    )
+
+
+@pytest.mark.parametrize("B", [0.0, -0.0], ids=["positive_zero", "negative_zero"])
+def test_quadratic_root_with_signed_zero(B):
+    """Both signed zeros give the root (-B - sqrt(B^2 - 4AC)) / 2A"""
+    A, C = 2.0, -8.0
+    assert _calculate_quadratic_root(A, np.array(B), C) == -2.0
+
+
+def test_quadratic_root_matches_direct_formula():
+    rng = np.random.default_rng(0)
+    A = rng.uniform(0.5, 5, size=1000)
+    B = rng.uniform(-5, 5, size=1000)
+    C = rng.uniform(-5, 0, size=1000)
+    np.testing.assert_allclose(
+        _calculate_quadratic_root(A, B, C),
+        (-B - np.sqrt(B**2 - 4 * A * C)) / (2 * A),
+        rtol=1e-10,
+    )
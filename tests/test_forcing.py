@@ -0,0 +1,38 @@
+"""Test the interpolation of forcing data used during a simulation"""
+
+import numpy as np
+import pytest
+from seaice3p.params.forcing import _MonotoneInterpolator
+
+XP = np.array([0.0, 0.5, 0.7, 2.0, 2.1, 3.5, 5.0])
+FP = np.array([-10.0, -12.5, -3.0, 4.0, 0.5, -7.25, 1.0])
+
+
+def _expected(x):
+    return np.interp(x, XP, FP, right=np.nan)
+
+
+@pytest.mark.parametrize(
+    "times",
+    [
+        np.linspace(0, 5, 101),
+        np.linspace(5, 0, 101),
+        XP,
+        XP[::-1],
+        np.array([-1.0, 5.0, 6.0, 0.0, 4.999, 7.5, 2.05, -0.5]),
+    ],
+    ids=["increasing", "decreasing", "knots", "knots_reversed", "out_of_range"],
+)
+def test_monotone_interpolator_matches_interp(times):
+    interpolator = _MonotoneInterpolator(XP, FP)
+    for time in times:
+        np.testing.assert_allclose(interpolator(time), _expected(time), rtol=1e-14)
+
+
+def test_monotone_interpolator_with_rejected_steps():
+    """The solver steps back in time when it rejects a step"""
+    rng = np.random.default_rng(0)
+    times = np.cumsum(rng.uniform(-0.02, 0.03, size=1000))
+    interpolator = _MonotoneInterpolator(XP, FP)
+    for time in times:
+        np.testing.assert_allclose(interpolator(time), _expected(time), rtol=1e-14)
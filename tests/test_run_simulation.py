@@ -3,6 +3,7 @@ from glob import glob
 from pathlib import Path
 from seaice3p import (
     solve,
+    run_batch,
     DimensionalParams,
     Config,
     get_config,
@@ -16,6 +17,8 @@ from seaice3p import (
     DimensionalPowerLawBubbleParams,
     DimensionalMonoBubbleParams,
     NumericalParams,
+    DimensionalWaterParams,
+    CubicLiquidus,
 )
 
 COMMON_PARAMS = {
@@ -80,6 +83,34 @@ def test_short_solve(tmp_path, simulation_parameters: DimensionalParams):
     solve(get_config(simulation_parameters), tmp_path)
 
 
+def test_parallel_batch(tmp_path):
+    """Both simulations run on the pool, including a cubic liquidus configuration
+    which must be sent to a worker process"""
+    list_of_cfg = [
+        get_config(
+            DimensionalParams(
+                name=name,
+                water_params=water_params,
+                brine_convection_params=BRINE,
+                forcing_config=DimensionalBRW09Forcing(),
+                ocean_forcing_config=DimensionalBRW09OceanForcing(),
+                initial_conditions_config=BRW09InitialConditions(),
+                gas_params=DimensionalEQMGasParams(),
+                bubble_params=DimensionalMonoBubbleParams(),
+                numerical_params=NUM,
+                **COMMON_PARAMS
+            )
+        )
+        for name, water_params in [
+            ("linear_liquidus", DimensionalWaterParams()),
+            ("cubic_liquidus", DimensionalWaterParams(liquidus=CubicLiquidus())),
+        ]
+    ]
+    run_batch(list_of_cfg, tmp_path, number_of_processes=2)
+    assert (tmp_path / "linear_liquidus.npz").exists()
+    assert (tmp_path / "cubic_liquidus.npz").exists()
+
+
 @pytest.mark.slow
 def test_best_barrow_config(tmp_path):
     solve(